@@ -0,0 +1,11 @@
+-- Migration 008: Index approved grants that carry a detailed proposal
+-- Lets trigger_milestone_creation read only the grants it can act on
+-- instead of scanning every approved grant and parsing metadata in Python.
+--
+-- Note: run_migrations.py applies each file inside a transaction, so this
+-- uses a plain CREATE INDEX. On a busy database create it by hand with
+-- CREATE INDEX CONCURRENTLY before running the migration.
+
+CREATE INDEX IF NOT EXISTS idx_grants_approved_with_proposal
+    ON grants (created_at DESC)
+    WHERE status = 'approved' AND metadata ? 'detailed_proposal';
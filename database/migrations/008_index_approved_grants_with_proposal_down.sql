@@ -0,0 +1,3 @@
+-- Migration 008 Rollback: Drop approved-with-proposal index
+
+DROP INDEX IF EXISTS idx_grants_approved_with_proposal;
@@ -0,0 +1,11 @@
+-- Migration 009: Partial index for submitted milestones awaiting agent review
+-- trigger_milestone_evaluations.py scans submitted milestones newest first and
+-- anti-joins agent_milestone_reviews on milestone_id, which is already covered
+-- by idx_agent_reviews_milestone (migration 006).
+--
+-- Plain CREATE INDEX because run_migrations.py wraps each file in a
+-- transaction; on a busy database create it CONCURRENTLY by hand first.
+
+CREATE INDEX IF NOT EXISTS idx_milestones_submitted_created_at
+    ON milestones (created_at DESC)
+    WHERE status = 'submitted';
@@ -0,0 +1,3 @@
+-- Migration 009 Rollback: Drop submitted milestones partial index
+
+DROP INDEX IF EXISTS idx_milestones_submitted_created_at;
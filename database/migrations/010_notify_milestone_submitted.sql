@@ -0,0 +1,19 @@
+-- Migration 010: Notify agent evaluation workers when a milestone is submitted
+-- trigger_milestone_evaluations.py --listen runs LISTEN agent_eval_queue and
+-- evaluates each milestone as it arrives instead of rescanning on a schedule.
+
+CREATE OR REPLACE FUNCTION notify_milestone_submitted()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('agent_eval_queue', NEW.milestone_id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS milestone_submitted_notify ON milestones;
+
+CREATE TRIGGER milestone_submitted_notify
+    AFTER UPDATE OF status ON milestones
+    FOR EACH ROW
+    WHEN (NEW.status = 'submitted' AND OLD.status IS DISTINCT FROM 'submitted')
+    EXECUTE FUNCTION notify_milestone_submitted();
@@ -0,0 +1,4 @@
+-- Migration 010 Rollback: Remove milestone submission notifications
+
+DROP TRIGGER IF EXISTS milestone_submitted_notify ON milestones;
+DROP FUNCTION IF EXISTS notify_milestone_submitted();
@@ -10,6 +10,8 @@ from decimal import Decimal
 from datetime import datetime
 import uuid
 
+from psycopg2.extras import execute_values
+
 from utils.database import get_db_cursor
 
 logger = logging.getLogger(__name__)
@@ -110,6 +112,69 @@ class ReviewsRepository:
                 'created_at': result['created_at']
             }
     
+    def create_agent_reviews_batch(
+        self,
+        reviews: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many agent reviews in one transaction
+        
+        Args:
+            reviews: Review dicts with the same keys as create_agent_review's arguments
+        
+        Returns:
+            List of created review identifiers (review_id, milestone_id, agent_name)
+        """
+        if not reviews:
+            return []
+        
+        with get_db_cursor() as cur:
+            created = execute_values(cur, """
+                INSERT INTO agent_milestone_reviews (
+                    milestone_id, agent_id, agent_name, recommendation,
+                    confidence_score, review_score, feedback,
+                    strengths, weaknesses, suggestions,
+                    deliverables_met, quality_rating, documentation_rating,
+                    code_quality_rating, review_duration_seconds
+                )
+                VALUES %s
+                RETURNING review_id, milestone_id, agent_name, recommendation, review_score
+            """, [(
+                str(review['milestone_id']), review['agent_id'], review['agent_name'],
+                review['recommendation'], review.get('confidence_score'),
+                review.get('review_score'), review['feedback'],
+                review.get('strengths'), review.get('weaknesses'), review.get('suggestions'),
+                review.get('deliverables_met'), review.get('quality_rating'),
+                review.get('documentation_rating'), review.get('code_quality_rating'),
+                review.get('review_duration_seconds')
+            ) for review in reviews], fetch=True)
+            
+            # Log to agent_activity_log for tracking evaluations count
+            execute_values(cur, """
+                INSERT INTO agent_activity_log (
+                    agent_name, activity_type, action, details
+                )
+                VALUES %s
+            """, [(
+                row['agent_name'],
+                'milestone_reviewed',  # Match the database constraint
+                'completed_review',
+                json.dumps({
+                    'milestone_id': str(row['milestone_id']),
+                    'recommendation': row['recommendation'],
+                    'score': float(row['review_score']) if row['review_score'] else None,
+                    'review_id': str(row['review_id'])
+                })
+            ) for row in created])
+            
+            cur.connection.commit()
+            
+            return [{
+                'review_id': str(row['review_id']),
+                'milestone_id': str(row['milestone_id']),
+                'agent_name': row['agent_name']
+            } for row in created]
+    
     def get_agent_reviews_by_milestone(
         self,
         milestone_id: uuid.UUID
@@ -280,14 +280,7 @@ async def submit_votes(request: VoteSubmissionRequest) -> Dict[str, Any]:
                 "timestamp": datetime.now().isoformat()
             }
             
-            # Find option value
-            option_value = 50  # default
-            for opt in poll["options"]:
-                if opt["id"] == vote.option:
-                    option_value = opt["value"]
-                    break
-            
-            vote_record["option_value"] = option_value
+            # Option values are looked up from the poll's options at analysis
             poll["votes"].append(vote_record)
         
         # Update poll in storage
@@ -360,7 +353,8 @@ async def get_poll_results(
             votes=poll.get("votes", []),
             voting_strategy=strategy,
             total_tokens=total_tokens,
-            grant_amount=None  # Could be passed as query param
+            grant_amount=None,  # Could be passed as query param
+            poll_options=poll.get("options")
         )
         
         logger.info(
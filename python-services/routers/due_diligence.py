@@ -6,6 +6,7 @@ Endpoints for team background checks and verification
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List
+import asyncio
 import logging
 
 from services.due_diligence import DueDiligenceAnalyzer
@@ -148,9 +149,11 @@ async def analyze_due_diligence(request: DueDiligenceRequest) -> DueDiligenceRes
             'experience': request.team_experience
         }
         
-        # Get analyzer and perform analysis
+        # Get analyzer and perform analysis. It blocks on HTTP calls and
+        # rate-limit waits, so it runs on a worker thread, off the event loop
         analyzer = get_dd_analyzer()
-        result = analyzer.perform_due_diligence(
+        result = await asyncio.to_thread(
+            analyzer.perform_due_diligence,
             grant_id=request.grant_id,
             team_info=team_info,
             github_profiles=request.github_profiles,
@@ -244,7 +247,7 @@ async def analyze_github_profile(username: str) -> Dict[str, Any]:
                 detail="Invalid GitHub username or URL"
             )
         
-        analysis = analyzer.analyze_github_profile(clean_username)
+        analysis = await asyncio.to_thread(analyzer.analyze_github_profile, clean_username)
         
         if not analysis.get('profile_found'):
             raise HTTPException(
@@ -287,7 +290,7 @@ async def analyze_wallet(address: str, network: str = "ethereum") -> Dict[str, A
     try:
         analyzer = get_dd_analyzer()
         
-        analysis = analyzer.analyze_wallet_address(address, network)
+        analysis = await asyncio.to_thread(analyzer.analyze_wallet_address, address, network)
         
         if not analysis.get('valid_address'):
             raise HTTPException(
@@ -251,7 +251,9 @@ async def comprehensive_evaluation(request: EvaluationRequest) -> EvaluationResp
                 logger.info(f"Running due diligence for {grant_id}")
                 dd_analyzer = analyzers["due_diligence"]
                 
-                dd_result = dd_analyzer.perform_due_diligence(
+                # Blocks on HTTP calls and rate-limit waits, so keep it off the event loop
+                dd_result = await asyncio.to_thread(
+                    dd_analyzer.perform_due_diligence,
                     grant_id=grant_id,
                     team_size=request.proposal.team_size or 1,
                     experience_level=request.proposal.team_experience or "intermediate",
@@ -1,6 +1,7 @@
 import psycopg2
 import os
 import json
+import traceback
 import uuid
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -116,7 +117,6 @@ try:
 except Exception as e:
     conn.rollback()
     print(f"\n❌ Error: {e}")
-    import traceback
     traceback.print_exc()
 finally:
     cur.close()
@@ -4,6 +4,7 @@ Test script for both Technical and Impact Analysis endpoints
 
 import requests
 import json
+import traceback
 from datetime import datetime
 
 
@@ -98,7 +99,6 @@ def test_technical_endpoint():
             
     except Exception as e:
         print(f"\n❌ TEST FAILED: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -173,7 +173,6 @@ def test_impact_endpoint():
             
     except Exception as e:
         print(f"\n❌ TEST FAILED: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -4,6 +4,7 @@ Tests the budget analyzer directly without API endpoints
 """
 
 import sys
+import traceback
 sys.path.insert(0, 'c:\\Users\\pryyy\\Projects\\agentdao\\python-services')
 
 from services.budget_analyzer import BudgetAnalyzer
@@ -173,7 +174,6 @@ def test_well_structured_budget():
         
     except Exception as e:
         print(f"\n❌ TEST FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -248,7 +248,6 @@ def test_overpriced_budget():
         
     except Exception as e:
         print(f"\n❌ TEST FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -322,7 +321,6 @@ def test_underbudgeted_project():
         
     except Exception as e:
         print(f"\n❌ TEST FAILED: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -9,6 +9,7 @@ Tests:
 """
 
 import sys
+import traceback
 sys.path.insert(0, 'c:\\Users\\pryyy\\Projects\\agentdao\\python-services')
 
 from services.community_sentiment import CommunitySentimentAnalyzer, VotingStrategy
@@ -337,7 +338,6 @@ def run_all_tests():
         
     except Exception as e:
         print(f"\n❌ Test execution failed: {e}")
-        import traceback
         traceback.print_exc()
     
     # Summary
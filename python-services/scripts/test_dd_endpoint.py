@@ -4,6 +4,7 @@ Test script for Due Diligence Analysis API endpoint
 
 import requests
 import json
+import traceback
 from datetime import datetime
 
 
@@ -132,7 +133,6 @@ def test_legitimate_team():
             
     except Exception as e:
         print(f"\n❌ TEST FAILED: {e}")
-        import traceback
         traceback.print_exc()
 
 
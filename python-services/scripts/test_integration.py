@@ -15,6 +15,14 @@ from datetime import datetime
 import time
 
 
+# Simulated community votes (strong support), stored column-wise and built once
+SIMULATED_VOTERS = tuple(f"0x{i:040x}" for i in range(22))
+SIMULATED_OPTIONS = ("strongly_approve",) * 10 + ("approve",) * 8 + ("neutral",) * 4
+SIMULATED_OPTION_VALUES = (100,) * 10 + (75,) * 8 + (50,) * 4
+SIMULATED_TOKEN_BALANCES = (10000,) * 10 + (5000,) * 8 + (2000,) * 4
+SIMULATED_REPUTATION_SCORES = (90,) * 10 + (75,) * 8 + (60,) * 4
+
+
 def print_section(title: str):
     """Print a section separator"""
     print("\n" + "=" * 80)
@@ -210,6 +218,7 @@ def test_unified_evaluation():
     print_section("5. COMMUNITY SENTIMENT")
     try:
         community_analyzer = CommunitySentimentAnalyzer()
+        strategy = VotingStrategy.HYBRID
         
         # Create poll
         poll_result = community_analyzer.create_poll(
@@ -217,29 +226,20 @@ def test_unified_evaluation():
             title=f"Should we fund: {grant_data['title']}?",
             description=grant_data["description"],
             duration_hours=168,
-            voting_strategy=VotingStrategy.HYBRID
+            voting_strategy=strategy
         )
         
-        # Simulate community votes (strong support)
-        simulated_votes = [
-            {"voter_address": f"0x{i:040x}", "option": "strongly_approve", "option_value": 100, 
-             "token_balance": 10000, "reputation_score": 90}
-            for i in range(10)
-        ] + [
-            {"voter_address": f"0x{i:040x}", "option": "approve", "option_value": 75,
-             "token_balance": 5000, "reputation_score": 75}
-            for i in range(10, 18)
-        ] + [
-            {"voter_address": f"0x{i:040x}", "option": "neutral", "option_value": 50,
-             "token_balance": 2000, "reputation_score": 60}
-            for i in range(18, 22)
-        ]
+        poll_id = poll_result["poll"]["poll_id"]
         
         # Analyze votes
-        sentiment_result = community_analyzer.analyze_poll_results(
-            poll_id=poll_result["poll"]["poll_id"],
-            votes=simulated_votes,
-            voting_strategy=VotingStrategy.HYBRID,
+        sentiment_result = community_analyzer.analyze_poll_results_arrays(
+            poll_id=poll_id,
+            voters=SIMULATED_VOTERS,
+            options=SIMULATED_OPTIONS,
+            option_values=SIMULATED_OPTION_VALUES,
+            token_balances=SIMULATED_TOKEN_BALANCES,
+            reputation_scores=SIMULATED_REPUTATION_SCORES,
+            voting_strategy=strategy,
             total_tokens=200000,
             grant_amount=grant_data["total_amount"]
         )
@@ -53,14 +53,16 @@ def create_milestones_for_grant(grant: dict, milestones_data: list) -> int:
         grant_id = uuid.UUID(str(grant.get('grant_id')))
         milestones_repo = MilestonesRepository()
         
-        requested_amount = float(grant.get('requested_amount', 0))
+        # Decimal end to end so amounts land in the NUMERIC column exactly and
+        # percentages summing to 100 add back up to requested_amount
+        requested_amount = Decimal(str(grant.get('requested_amount', 0)))
         milestone_records = []
         
         logger.info(f"Processing {len(milestones_data)} milestones for grant '{grant.get('title')}'")
         
         for idx, m in enumerate(milestones_data):
-            funding_percentage = float(m.get('fundingPercentage', 0))
-            amount = (requested_amount * funding_percentage) / 100
+            funding_percentage = Decimal(str(m.get('fundingPercentage', 0)))
+            amount = (requested_amount * funding_percentage) / Decimal(100)
             duration_weeks = int(m.get('duration', 4))
             
             # Calculate estimated completion date
@@ -77,13 +79,13 @@ def create_milestones_for_grant(grant: dict, milestones_data: list) -> int:
                 'title': m.get('title', f'Milestone {idx + 1}'),
                 'description': m.get('description', ''),
                 'deliverables': deliverables,
-                'amount': str(amount),
+                'amount': format(amount, 'f'),
                 'currency': 'ETH',
                 'estimated_completion_date': estimated_date.strftime('%Y-%m-%d'),
                 'status': 'active' if idx == 0 else 'pending'  # First milestone is active
             })
             
-            logger.info(f"  Milestone {idx + 1}: {m.get('title')} - {amount:.4f} ETH ({funding_percentage}%)")
+            logger.info(f"  Milestone {idx + 1}: {m.get('title')} - {float(amount):.4f} ETH ({funding_percentage}%)")
         
         # Create milestones
         created_milestones = milestones_repo.create_batch(grant_id, milestone_records)
@@ -105,7 +107,9 @@ def create_milestones_for_grant(grant: dict, milestones_data: list) -> int:
         return len(created_milestones)
     
     except Exception as e:
-        logger.error(f"❌ Error creating milestones for grant '{grant.get('title')}': {e}", exc_info=True)
+        # One line per failing grant; the stack is only formatted with --debug
+        logger.error("❌ Error creating milestones for grant '%s': %s", grant.get('title'), e)
+        logger.debug("Stack for grant %s", grant.get('grant_id'), exc_info=True)
         return 0
 
 
@@ -130,22 +134,49 @@ def main():
                     metadata
                 FROM grants
                 WHERE status = 'approved'
+                AND metadata ? 'detailed_proposal'
+                AND CASE jsonb_typeof(metadata->'detailed_proposal')
+                    WHEN 'object' THEN
+                        jsonb_typeof(metadata->'detailed_proposal'->'milestones') = 'array'
+                        AND metadata->'detailed_proposal'->'milestones' <> '[]'::jsonb
+                    -- Proposals submitted through the API are stored as JSON strings;
+                    -- keep the ones that mention milestones and let Python parse them
+                    WHEN 'string' THEN metadata->>'detailed_proposal' LIKE '%"milestones"%'
+                    ELSE FALSE
+                END
                 ORDER BY created_at DESC
             """)
             
             approved_grants = cursor.fetchall()
         
         if not approved_grants:
-            logger.info("No approved grants found")
+            logger.info("No approved grants with milestone data found")
             return
         
-        logger.info(f"\nFound {len(approved_grants)} approved grant(s)")
+        logger.info(f"\nFound {len(approved_grants)} approved grant(s) with milestone data")
         logger.info("-" * 80)
         
         total_created = 0
         grants_processed = 0
         grants_skipped = 0
         
+        # Grants flagged as having milestones are checked against the table in
+        # one query up front, so no connection is held while milestones are created
+        flagged_ids = [
+            str(grant.get('grant_id')) for grant in approved_grants
+            if grant.get('has_milestones') and grant.get('total_milestones', 0) > 0
+        ]
+        existing_counts = {}
+        if flagged_ids:
+            with get_db_cursor() as cursor:
+                cursor.execute("""
+                    SELECT grant_id::text AS grant_id, COUNT(*) as count
+                    FROM milestones
+                    WHERE grant_id = ANY(%s::uuid[])
+                    GROUP BY grant_id
+                """, (flagged_ids,))
+                existing_counts = {row['grant_id']: row['count'] for row in cursor.fetchall()}
+        
         for grant in approved_grants:
             logger.info(f"\nGrant: {grant.get('title')}")
             logger.info(f"  ID: {grant.get('grant_id')}")
@@ -155,18 +186,12 @@ def main():
             # Skip if already has milestones created
             if grant.get('has_milestones') and grant.get('total_milestones', 0) > 0:
                 # Check if milestones actually exist in DB
-                with get_db_cursor() as cursor:
-                    cursor.execute("""
-                        SELECT COUNT(*) as count
-                        FROM milestones
-                        WHERE grant_id = %s
-                    """, (str(grant.get('grant_id')),))
-                    result = cursor.fetchone()
-                    
-                    if result.get('count', 0) > 0:
-                        logger.info(f"  ⏭️  Skipping - already has {result.get('count')} milestone(s)")
-                        grants_skipped += 1
-                        continue
+                count = existing_counts.get(str(grant.get('grant_id')), 0)
+                
+                if count > 0:
+                    logger.info(f"  ⏭️  Skipping - already has {count} milestone(s)")
+                    grants_skipped += 1
+                    continue
             
             # Extract milestones from detailed_proposal
             milestones_data = extract_milestones_from_grant(grant)
@@ -185,7 +210,7 @@ def main():
         logger.info("\n" + "=" * 80)
         logger.info("SUMMARY")
         logger.info("=" * 80)
-        logger.info(f"Total approved grants: {len(approved_grants)}")
+        logger.info(f"Approved grants with milestone data: {len(approved_grants)}")
         logger.info(f"Grants processed: {grants_processed}")
         logger.info(f"Grants skipped: {grants_skipped}")
         logger.info(f"Total milestones created: {total_created}")
@@ -203,4 +228,6 @@ def main():
 
 
 if __name__ == "__main__":
+    if "--debug" in sys.argv[1:]:
+        logger.setLevel(logging.DEBUG)
     main()
@@ -1,85 +1,633 @@
 """
 Trigger agent evaluations for all submitted milestones that don't have reviews yet.
+
+Run from the python-services directory as a module:
+
+    python -m scripts.trigger_milestone_evaluations [--listen]
+
+With --listen the script keeps running after the catch-up pass and evaluates
+milestones as the database announces their submission. Listening needs
+DATABASE_DIRECT_URL, a direct (or session-mode) connection string, since the
+transaction-mode pooler in DATABASE_URL does not deliver notifications.
 """
 import asyncio
+import logging
+import logging.handlers
+import multiprocessing
+import queue
 import sys
 import os
-from pathlib import Path
+import time
+from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 import psycopg2
-from dotenv import load_dotenv
+from psycopg2.extras import RealDictCursor
+
+# Importing utils.database loads .env and builds the shared pool, which checks
+# DATABASE_URL once and fails fast if it is missing; nothing here re-reads it
+from utils.database import db_pool, DatabaseConfig
+from services.milestone_evaluator import get_milestone_evaluator
+from repositories.reviews_repository import ReviewsRepository
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+EVAL_CONCURRENCY = int(os.getenv('EVAL_CONCURRENCY', '8'))
+# Pooled connections the script holds besides the evaluations' own: the
+# catch-up cursor (which also holds the claims) and the review inserts
+HELD_CONNECTIONS = 2
+FETCH_SIZE = int(os.getenv('EVAL_FETCH_SIZE', '500'))
+EVAL_TIMEOUT = int(os.getenv('EVAL_TIMEOUT_SECONDS', '120'))
+EVAL_RETRIES = 3
+# Reviews per insert transaction, so one bad row or dropped connection costs a chunk, not the batch
+INSERT_CHUNK_SIZE = int(os.getenv('EVAL_INSERT_CHUNK_SIZE', '50'))
+# Processes to spread evaluation over; 1 keeps everything on this process's event loop
+EVAL_WORKERS = int(os.getenv('EVAL_WORKERS', '1'))
+# LISTEN and PREPARE are session state, which a transaction-mode pooler (the
+# default DATABASE_URL, port 6543) does not keep, so --listen needs a direct one
+DATABASE_DIRECT_URL = os.getenv('DATABASE_DIRECT_URL')
+POOLER_TRANSACTION_PORT = 6543
+# Longest wait between attempts to reconnect the listener (seconds)
+RECONNECT_BACKOFF_CAP = 60
+# Cap on each statement this script runs (milliseconds, 0 disables). Set with
+# SET LOCAL per transaction so it never sticks to a shared pooled connection
+EVAL_STATEMENT_TIMEOUT = int(os.getenv('EVAL_STATEMENT_TIMEOUT_MS', '30000'))
 
-# Load environment variables
-load_dotenv()
+# Progress goes through a queue and is written to stdout by a listener thread,
+# so the event loop never blocks on console writes
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
-from services.milestone_evaluator import get_milestone_evaluator
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = logging.handlers.QueueListener(_log_queue, _console_handler)
 
-DATABASE_URL = os.getenv('DATABASE_URL')
+# Submitted milestones without agent reviews, along with every column the
+# evaluator reads so it doesn't have to load each milestone again
+_MILESTONE_COLUMNS = """
+    m.milestone_id, m.title, m.grant_id, m.milestone_number,
+    m.description, m.deliverables, m.amount, m.status,
+    m.proof_of_work_url, m.submission_notes
+"""
 
+_Q_SUBMITTED = f"""
+    SELECT {_MILESTONE_COLUMNS}
+    FROM milestones m
+    LEFT JOIN agent_milestone_reviews amr USING (milestone_id)
+    WHERE m.status = %s
+    AND amr.milestone_id IS NULL
+    ORDER BY m.created_at DESC
+"""
 
-def get_db_connection():
-    """Create database connection"""
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
+# The listener runs the same lookup for every notification batch, so it is
+# parsed and planned once per connection and then only executed
+_PREPARE_SUBMITTED_BY_ID = f"""
+    PREPARE pending_milestones_by_id (uuid[], text) AS
+    SELECT {_MILESTONE_COLUMNS}
+    FROM milestones m
+    LEFT JOIN agent_milestone_reviews amr USING (milestone_id)
+    WHERE m.milestone_id = ANY($1)
+    AND m.status = $2
+    AND amr.milestone_id IS NULL
+"""
+
+
+def set_statement_timeout(conn):
+    """Limit statements for the rest of conn's current transaction to EVAL_STATEMENT_TIMEOUT"""
+    if EVAL_STATEMENT_TIMEOUT > 0:
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL statement_timeout = %s", (EVAL_STATEMENT_TIMEOUT,))
+
+
+class CircuitBreaker:
+    """
+    Stop calling the evaluator after repeated failures
     
-    try:
-        conn = psycopg2.connect(DATABASE_URL)
-        return conn
-    except Exception as e:
-        print(f"❌ Failed to connect to database: {e}")
-        sys.exit(1)
+    Opens after fail_max consecutive failures and lets a call through
+    again once reset_timeout seconds have passed.
+    """
+    
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+    
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+    
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            self.opened_at = time.monotonic()
 
 
-async def trigger_evaluations():
-    """Find submitted milestones without agent reviews and trigger evaluations."""
-    conn = get_db_connection()
-    cur = conn.cursor()
+def open_pending_milestones_cursor():
+    """
+    Open a server-side cursor over submitted milestones that have no agent reviews yet
+    
+    Rows stay on the server and are pulled in FETCH_SIZE batches, so memory
+    is bounded by the batch rather than the size of the backlog.
+    """
+    conn = db_pool.get_connection()
     
     try:
-        # Find submitted milestones without agent reviews
+        set_statement_timeout(conn)
+        
+        # Rows are read by column name below, so ask for dict rows explicitly rather
+        # than relying on the pool's default cursor_factory
+        cur = conn.cursor(name="submitted_milestones", cursor_factory=RealDictCursor)
+        cur.itersize = FETCH_SIZE
+        
+        cur.execute(_Q_SUBMITTED, ("submitted",))
+    except Exception:
+        db_pool.return_connection(conn)
+        raise
+    
+    return conn, cur
+
+
+def release_cursor(conn, cur):
+    """Close the server-side cursor, end its transaction (dropping any claims) and hand the connection back to the pool"""
+    try:
+        cur.close()
+        conn.rollback()
+    finally:
+        db_pool.return_connection(conn)
+
+
+def check_direct_url():
+    """
+    Make sure the listener has a connection string that keeps session state
+    
+    Raises:
+        RuntimeError: DATABASE_DIRECT_URL is unset or points at the transaction pooler
+    """
+    if not DATABASE_DIRECT_URL:
+        raise RuntimeError(
+            "--listen requires DATABASE_DIRECT_URL: notifications are never delivered "
+            "through the transaction-mode pooler in DATABASE_URL"
+        )
+    if urlparse(DATABASE_DIRECT_URL).port == POOLER_TRANSACTION_PORT:
+        raise RuntimeError(
+            f"DATABASE_DIRECT_URL uses the transaction pooler port {POOLER_TRANSACTION_PORT}; "
+            "use the direct (or session-mode) connection string instead"
+        )
+
+
+def connect_direct():
+    """Open an autocommit connection straight to Postgres for the listener"""
+    check_direct_url()
+    
+    # A direct connection is this script's alone, so the timeout can be set for the session
+    connect_kwargs = {}
+    if EVAL_STATEMENT_TIMEOUT > 0:
+        connect_kwargs['options'] = f"-c statement_timeout={EVAL_STATEMENT_TIMEOUT}"
+    
+    config = DatabaseConfig()
+    conn = psycopg2.connect(
+        DATABASE_DIRECT_URL,
+        connect_timeout=config.connection_timeout,
+        keepalives=1,
+        keepalives_idle=config.keepalives_idle,
+        keepalives_interval=config.keepalives_interval,
+        keepalives_count=config.keepalives_count,
+        **connect_kwargs
+    )
+    conn.autocommit = True
+    return conn
+
+
+def prepare_pending_by_id(conn):
+    """Prepare the by-id lookup once on a connection the listener keeps for its lifetime"""
+    with conn.cursor() as cur:
+        cur.execute(_PREPARE_SUBMITTED_BY_ID)
+
+
+def fetch_pending_milestones_by_id(conn, milestone_ids):
+    """Load the given milestones if they are still submitted and have no agent reviews"""
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(
+            "EXECUTE pending_milestones_by_id (%s::uuid[], %s)",
+            (list(milestone_ids), "submitted")
+        )
+        return cur.fetchall()
+
+
+def claim_milestones(conn, milestone_ids):
+    """
+    Take a transaction advisory lock for each milestone another worker isn't already evaluating
+    
+    The locks are taken in conn's open transaction, on the connection the
+    milestones were read from, so no second connection sits idle in
+    transaction while they are evaluated. They last until the caller ends
+    that transaction, covering evaluation and the insert of the resulting
+    reviews. Transaction-scoped locks stay on one backend even behind a
+    transaction-mode pooler, where a session lock could outlive this script
+    on a backend another client reuses.
+    
+    Returns:
+        Set of claimed milestone ids
+    """
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
         cur.execute("""
-            SELECT m.milestone_id, m.title, m.grant_id
-            FROM milestones m
-            WHERE m.status = 'submitted'
-            AND NOT EXISTS (
-                SELECT 1 FROM agent_milestone_reviews amr
-                WHERE amr.milestone_id = m.milestone_id
+            SELECT id::text AS milestone_id
+            FROM unnest(%s::uuid[]) AS id
+            WHERE pg_try_advisory_xact_lock(hashtext('ms:' || id::text))
+        """, ([str(milestone_id) for milestone_id in milestone_ids],))
+        return {row['milestone_id'] for row in cur.fetchall()}
+
+
+def save_reviews(reviews_repo: ReviewsRepository, reviews):
+    """
+    Insert reviews in chunks, falling back to one insert per review when a chunk fails
+    
+    A review that still can't be saved is logged and skipped; its milestone
+    stays unreviewed and is picked up again by the next catch-up pass.
+    
+    Returns:
+        Number of reviews saved
+    """
+    saved = 0
+    for start in range(0, len(reviews), INSERT_CHUNK_SIZE):
+        chunk = reviews[start:start + INSERT_CHUNK_SIZE]
+        try:
+            saved += len(reviews_repo.create_agent_reviews_batch(chunk))
+            continue
+        except Exception as e:
+            logger.info("⚠️  Saving %d review(s) at once failed (%s); saving one at a time", len(chunk), e)
+        
+        for review in chunk:
+            try:
+                reviews_repo.create_agent_review(**review)
+                saved += 1
+            except Exception as e:
+                logger.info("❌ Could not save review for milestone %s: %s", review['milestone_id'], e)
+    
+    return saved
+
+
+class EvaluationRunner:
+    """Evaluates batches of milestones with bounded concurrency, retries and a circuit breaker"""
+    
+    def __init__(self, executor: Optional[ProcessPoolExecutor] = None, workers: int = 1):
+        # Build the (process-wide singleton) evaluator up front so its setup isn't
+        # paid while a server-side cursor holds a transaction open
+        self.evaluator = get_milestone_evaluator()
+        self.reviews_repo = ReviewsRepository()
+        
+        # Bound the fan-out so a large backlog doesn't open one evaluation per row at once.
+        # The pool raises rather than waits when it runs dry, so leave room for the
+        # connections the script holds itself
+        concurrency = EVAL_CONCURRENCY
+        pool_room = DatabaseConfig().max_connections - HELD_CONNECTIONS
+        if concurrency > pool_room:
+            logger.info(
+                "⚠️  EVAL_CONCURRENCY=%d exceeds the %d pooled connection(s) available; using %d",
+                concurrency, pool_room, max(pool_room, 1)
             )
-            ORDER BY m.created_at DESC
-        """)
+            concurrency = max(pool_room, 1)
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
         
-        milestones = cur.fetchall()
+        # Evaluations get their own threads so a hung one can't starve the
+        # default executor that the database calls below run on
+        self.eval_executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="evaluation")
+        self.breaker = CircuitBreaker(fail_max=5, reset_timeout=60)
         
-        if not milestones:
-            print("✅ No submitted milestones need evaluation (all have reviews or none submitted)")
+        self.executor = executor
+        self.workers = workers
+    
+    def _evaluate_blocking(self, milestone):
+        # The evaluator's rule code and repository calls block, so each evaluation
+        # gets its own event loop on an evaluation thread; that keeps this loop
+        # free and gives wait_for() something it can actually time out
+        return asyncio.run(
+            self.evaluator.evaluate_milestone(
+                milestone['milestone_id'], persist=False, context=milestone, raise_errors=True
+            )
+        )
+    
+    async def evaluate(self, milestone):
+        loop = asyncio.get_running_loop()
+        for attempt in range(EVAL_RETRIES):
+            if not self.breaker.allow():
+                raise RuntimeError("Skipped - evaluator circuit open after repeated failures")
+            
+            async with self.semaphore:
+                future = loop.run_in_executor(self.eval_executor, self._evaluate_blocking, milestone)
+                try:
+                    result = await asyncio.wait_for(asyncio.shield(future), timeout=EVAL_TIMEOUT)
+                except asyncio.TimeoutError:
+                    self.breaker.record_failure()
+                    # The thread can't be killed, so it keeps its slot until it
+                    # finishes and no retry runs alongside it; its outcome is dropped
+                    await asyncio.gather(future, return_exceptions=True)
+                except Exception:
+                    self.breaker.record_failure()
+                    raise
+                else:
+                    # None here means the milestone needed no review; errors were raised above
+                    self.breaker.record_success()
+                    return result
+            
+            # Back off outside the semaphore so the slot goes to another milestone
+            if attempt + 1 < EVAL_RETRIES:
+                await asyncio.sleep(2 ** attempt)
+        
+        raise TimeoutError(f"Evaluation timed out after {EVAL_RETRIES} attempt(s)")
+    
+    def close(self):
+        """Wait for evaluation threads to finish and release them"""
+        self.eval_executor.shutdown()
+    
+    async def _evaluate_tagged(self, milestone):
+        # as_completed hands back anonymous futures, so carry the milestone with its result
+        try:
+            return milestone, await self.evaluate(milestone)
+        except Exception as e:
+            return milestone, e
+    
+    def _report(self, milestone, result, reviews):
+        if isinstance(result, Exception):
+            status = f"❌ Error: {result}"
+        elif result is None:
+            # The evaluator declined (already reviewed or no longer submitted)
+            status = "⏭️  Skipped - no review produced"
+        else:
+            reviews.append(result)
+            status = "✅ Evaluation completed"
+        
+        # One record per milestone rather than one write per line
+        logger.info(
+            "📝 Milestone: %s\n   ID: %s\n   Grant ID: %s\n   %s\n",
+            milestone['title'], milestone['milestone_id'], milestone['grant_id'], status
+        )
+    
+    async def process_batch(self, milestones, conn):
+        """
+        Claim and evaluate a batch of milestones
+        
+        Args:
+            milestones: Milestone rows
+            conn: Connection the rows were read from, inside the transaction
+                that will hold the claims until the caller ends it
+        """
+        # Claim the batch first so concurrent workers (overlapping cron runs or
+        # listeners) never evaluate the same milestone twice
+        claimed = await asyncio.to_thread(
+            claim_milestones, conn, [milestone['milestone_id'] for milestone in milestones]
+        )
+        
+        await self._process_claimed(
+            [m for m in milestones if str(m['milestone_id']) in claimed]
+        )
+        
+        for milestone in milestones:
+            if str(milestone['milestone_id']) not in claimed:
+                logger.info(
+                    "📝 Milestone: %s\n   ID: %s\n   ⏭️  Skipped - being evaluated by another worker\n",
+                    milestone['title'], milestone['milestone_id']
+                )
+    
+    async def _process_claimed(self, milestones):
+        reviews = []
+        
+        if self.executor is not None:
+            # Shard the batch across worker processes, each running its own event loop
+            loop = asyncio.get_running_loop()
+            shards = [milestones[i::self.workers] for i in range(self.workers)]
+            futures = [
+                loop.run_in_executor(self.executor, evaluate_shard, shard)
+                for shard in shards if shard
+            ]
+            for next_done in asyncio.as_completed(futures):
+                for milestone, result in await next_done:
+                    self._report(milestone, result, reviews)
+        else:
+            tasks = [asyncio.create_task(self._evaluate_tagged(milestone)) for milestone in milestones]
+            
+            # Report each milestone as soon as its evaluation finishes instead of
+            # waiting for the slowest one in the batch
+            for next_done in asyncio.as_completed(tasks):
+                milestone, result = await next_done
+                self._report(milestone, result, reviews)
+        
+        # Save reviews a chunk per transaction instead of one commit each. Anything
+        # escaping here would end the catch-up run or the listener, so log and move on
+        try:
+            await asyncio.to_thread(save_reviews, self.reviews_repo, reviews)
+        except Exception as e:
+            logger.info("❌ Error saving reviews: %s", e)
+
+
+def evaluate_shard(milestones):
+    """
+    Worker process entry point: evaluate one shard of a batch on a fresh event loop
+    
+    Reviews come back unsaved so the parent still inserts them in chunks.
+    """
+    async def _run():
+        runner = EvaluationRunner()
+        try:
+            return await asyncio.gather(*[runner._evaluate_tagged(m) for m in milestones])
+        finally:
+            runner.close()
+    
+    # Send errors back as plain RuntimeErrors so they always survive pickling
+    return [
+        (milestone, RuntimeError(str(result)) if isinstance(result, Exception) else result)
+        for milestone, result in asyncio.run(_run())
+    ]
+
+
+async def trigger_evaluations(runner: EvaluationRunner):
+    """Find submitted milestones without agent reviews and trigger evaluations."""
+    # Borrow a connection from the service-wide pool (utils.database) rather than opening
+    # a fresh one; psycopg2 blocks, so every driver call runs on a worker thread
+    conn, cur = await asyncio.to_thread(open_pending_milestones_cursor)
+    
+    try:
+        total = 0
+        while True:
+            milestones = await asyncio.to_thread(cur.fetchmany, FETCH_SIZE)
+            if not milestones:
+                break
+            
+            if not total:
+                logger.info("Found submitted milestone(s) without agent reviews:\n")
+            total += len(milestones)
+            
+            # Claims are taken in the cursor's transaction and released with it
+            await runner.process_batch(milestones, conn)
+        
+        if not total:
+            logger.info("✅ No submitted milestones need evaluation (all have reviews or none submitted)")
+            return
+        
+        logger.info("\n✅ Triggered evaluations for %d milestone(s)", total)
+    
+    finally:
+        await asyncio.to_thread(release_cursor, conn, cur)
+
+
+async def listen_for_submissions(runner: EvaluationRunner):
+    """
+    Evaluate milestones as they are submitted
+    
+    Waits on NOTIFY agent_eval_queue (sent by the milestone_submitted_notify
+    trigger, migration 010) instead of rescanning the milestones table. The
+    catch-up pass runs only once LISTEN is in place, so nothing submitted in
+    between is missed, and the whole sequence starts over whenever the
+    connection to the database is lost.
+    """
+    reconnect_attempt = 0
+    while True:
+        try:
+            await _listen_once(runner)
+            reconnect_attempt = 0
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            delay = min(RECONNECT_BACKOFF_CAP, 2 ** reconnect_attempt)
+            reconnect_attempt += 1
+            logger.info("⚠️  Lost the database connection (%s); reconnecting in %ds\n", e, delay)
+            await asyncio.sleep(delay)
+
+
+async def _listen_once(runner: EvaluationRunner):
+    """
+    Listen on fresh connections until one of them fails
+    
+    Raises:
+        psycopg2.OperationalError: A connection to the database was lost
+    """
+    loop = asyncio.get_running_loop()
+    # Payloads, or None once the listening connection has failed
+    submitted = asyncio.Queue()
+    
+    # Both connections are opened directly rather than borrowed from the pool:
+    # the LISTEN and the prepared lookup must stay on one backend for as long
+    # as the connections last. Lookups use the second so queries never race the
+    # event loop's poll() on the listening one
+    conn = await asyncio.to_thread(connect_direct)
+    try:
+        fetch_conn = await asyncio.to_thread(connect_direct)
+    except Exception:
+        conn.close()
+        raise
+    
+    # Kept, since fileno() raises once the connection has been closed
+    fd = conn.fileno()
+    
+    def _drain_notifications():
+        try:
+            conn.poll()
+        except psycopg2.Error:
+            # Stop watching the dead socket and wake the loop below to reconnect
+            loop.remove_reader(fd)
+            submitted.put_nowait(None)
             return
+        while conn.notifies:
+            submitted.put_nowait(conn.notifies.pop(0).payload)
+    
+    try:
+        with conn.cursor() as cur:
+            cur.execute("LISTEN agent_eval_queue")
+        await asyncio.to_thread(prepare_pending_by_id, fetch_conn)
+        # Each batch is looked up and claimed in its own transaction from here on
+        fetch_conn.autocommit = False
+        loop.add_reader(fd, _drain_notifications)
         
-        print(f"Found {len(milestones)} submitted milestone(s) without agent reviews:\n")
+        # Catch up on anything submitted while no worker was listening
+        try:
+            await trigger_evaluations(runner)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            raise
+        except Exception as e:
+            # Anything it missed is picked up by the next catch-up pass
+            logger.info("❌ Error during catch-up: %s\n", e)
         
-        evaluator = get_milestone_evaluator()
+        logger.info("👂 Listening for submitted milestones...\n")
         
-        for milestone_id, title, grant_id in milestones:
-            print(f"📝 Milestone: {title}")
-            print(f"   ID: {milestone_id}")
-            print(f"   Grant ID: {grant_id}")
-            print(f"   Triggering evaluation...")
+        while True:
+            # Collect every submission that is already queued into one batch
+            milestone_ids = {await submitted.get()}
+            while not submitted.empty():
+                milestone_ids.add(submitted.get_nowait())
+            if None in milestone_ids:
+                raise psycopg2.OperationalError("listening connection closed")
             
             try:
-                await evaluator.evaluate_milestone(milestone_id)
-                print(f"   ✅ Evaluation completed\n")
+                milestones = await asyncio.to_thread(
+                    fetch_pending_milestones_by_id, fetch_conn, milestone_ids
+                )
+                if milestones:
+                    await runner.process_batch(milestones, fetch_conn)
+                # Ends the batch's transaction, releasing its claims
+                await asyncio.to_thread(fetch_conn.rollback)
             except Exception as e:
-                print(f"   ❌ Error: {str(e)}\n")
-                continue
-        
-        print(f"\n✅ Triggered evaluations for {len(milestones)} milestone(s)")
-        
+                if fetch_conn.closed:
+                    raise psycopg2.OperationalError(f"lookup connection closed: {e}")
+                # One bad batch shouldn't stop the worker; its milestones are
+                # retried by the catch-up pass after the next reconnect or restart
+                logger.info("❌ Error processing submitted milestone(s): %s\n", e)
+                await asyncio.to_thread(fetch_conn.rollback)
+    
     finally:
-        cur.close()
+        loop.remove_reader(fd)
+        # Closing ends the sessions, which drops the LISTEN and the prepared statement
         conn.close()
+        fetch_conn.close()
+
+
+async def main(listen: bool):
+    if listen:
+        # Fail before the catch-up pass rather than after it
+        check_direct_url()
+    
+    executor = None
+    if EVAL_WORKERS > 1:
+        # spawn, not fork, so workers open their own database connections
+        # instead of inheriting this process's pooled sockets
+        executor = ProcessPoolExecutor(
+            max_workers=EVAL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    
+    runner = None
+    try:
+        runner = EvaluationRunner(executor=executor, workers=EVAL_WORKERS)
+        
+        if listen:
+            # Runs the catch-up pass itself, once LISTEN is in place
+            await listen_for_submissions(runner)
+        else:
+            await trigger_evaluations(runner)
+    finally:
+        if runner is not None:
+            runner.close()
+        if executor is not None:
+            executor.shutdown()
 
 
 if __name__ == "__main__":
-    print("🤖 Triggering agent evaluations for submitted milestones...\n")
-    asyncio.run(trigger_evaluations())
+    # uvloop is optional; fall back to the default asyncio loop when it isn't installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    log_listener.start()
+    try:
+        logger.info("🤖 Triggering agent evaluations for submitted milestones...\n")
+        asyncio.run(main(listen="--listen" in sys.argv[1:]))
+    finally:
+        # Flushes anything still queued before the process exits
+        log_listener.stop()
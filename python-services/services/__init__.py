@@ -3,6 +3,13 @@ Services package for AgentDAO
 Contains business logic and analysis services
 """
 
-from .technical_analyzer import TechnicalAnalyzer
-
 __all__ = ["TechnicalAnalyzer"]
+
+
+def __getattr__(name):
+    # Imported on first access so `services.<submodule>` imports don't pay for
+    # the technical analyzer's dependencies (PEP 562)
+    if name == "TechnicalAnalyzer":
+        from .technical_analyzer import TechnicalAnalyzer
+        return TechnicalAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,12 +3,18 @@ Budget Analyzer Service for AgentDAO
 Analyzes grant proposal budgets for reasonability, market alignment, and red flags
 """
 
+import copy
+import hashlib
 import json
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 import logging
-from decimal import Decimal
 
 from config import settings
 from utils.common import get_utc_now
@@ -17,6 +23,372 @@ from utils.common import get_utc_now
 # Setup logger
 logger = logging.getLogger(__name__)
 
+class BudgetCategory(IntEnum):
+    """Budget categories the analyzer reasons about, as small integer ids"""
+    DEVELOPMENT = 0
+    MARKETING = 1
+    OPERATIONS = 2
+    AUDITS = 3
+    CONTINGENCY = 4
+    SECURITY = 5  # 'audit' / 'security' items, which count as an audit but not as 'audits'
+    OTHER = 6
+
+
+# Lowercased category name -> BudgetCategory, resolved once per item at parse time
+_CATEGORY_IDS = {
+    'development': BudgetCategory.DEVELOPMENT,
+    'marketing': BudgetCategory.MARKETING,
+    'operations': BudgetCategory.OPERATIONS,
+    'audits': BudgetCategory.AUDITS,
+    'contingency': BudgetCategory.CONTINGENCY,
+    'audit': BudgetCategory.SECURITY,
+    'security': BudgetCategory.SECURITY
+}
+
+# Categories a complete budget should cover (the first four ids)
+_EXPECTED_CATEGORY_COUNT = 4
+
+# Market-rate keyword patterns, compiled once. These are plain alternations (no
+# word boundaries) so a match means the same as any(word in description ...),
+# e.g. 'dev' still matches 'development'
+_DEVELOPER_RE = re.compile(r'developer|engineer|programmer|dev')
+_DESIGNER_RE = re.compile(r'designer|design|ui|ux')
+_AUDIT_RE = re.compile(r'audit|security review|penetration test')
+_MARKETING_RE = re.compile(r'marketing|advertising|promotion')
+_INFRASTRUCTURE_RE = re.compile(r'hosting|server|cloud|infrastructure')
+_SENIOR_OR_LEAD_RE = re.compile(r'senior|lead')
+
+# Description checks behind the vague-item and contingency red flags
+_VAGUE_TERM_RE = re.compile(r'miscellaneous|other|various|expenses|costs')
+_CONTINGENCY_RE = re.compile(r'contingency|buffer')
+
+# Per-item description flags (bit mask stored in breakdown['item_flags'])
+ITEM_VAGUE = 1
+ITEM_CONTINGENCY = 2  # mentions 'contingency' or 'buffer'
+ITEM_MENTIONS_CONTINGENCY = 4  # mentions 'contingency' itself
+
+
+# Message templates for the structured issue / warning codes
+_ISSUE_TEMPLATES = {
+    'budget_too_low': (
+        "Budget seems too low: ${total:,.0f} for {months} months "
+        "(minimum recommended: ${limit:,.0f})"
+    ),
+    'budget_too_high': (
+        "Budget seems unreasonably high: ${total:,.0f} for {months} months "
+        "(maximum reasonable: ${limit:,.0f})"
+    ),
+    'category_missing': "Missing {category} budget (recommended: {recommended}% or ${amount:,.0f})",
+    'category_low': "{title} budget is low: {percentage:.1f}% (recommended: {recommended}%)",
+    'category_high': "{title} budget is high: {percentage:.1f}% (recommended: {recommended}%)"
+}
+
+
+def render_issues(issue_codes: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+    """
+    Render structured (code, params) issues into display messages
+    
+    Args:
+        issue_codes: Issues as recorded by check_budget_reasonability
+    
+    Returns:
+        Human-readable messages, in the same order
+    """
+    messages = []
+    for code, params in issue_codes:
+        if 'category' in params:
+            params = {**params, 'title': params['category'].title()}
+        messages.append(_ISSUE_TEMPLATES[code].format(**params))
+    return messages
+
+
+def format_market_range(market_min: float, market_max: float) -> str:
+    """Format a market price band for display, e.g. '$6,000 - $10,000'"""
+    return f"${market_min:,.0f} - ${market_max:,.0f}"
+
+
+def render_market_item(priced_item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Render a compare_market_rates item into its API form
+    
+    Args:
+        priced_item: Item with raw market_min/max/avg and deviation_pct figures
+    
+    Returns:
+        Item with 'market_range' and, when outside the band, a 'deviation' string
+    """
+    rendered = {
+        'description': priced_item['description'],
+        'amount': priced_item['amount'],
+        'market_range': format_market_range(priced_item['market_min'], priced_item['market_max'])
+    }
+    
+    amount = priced_item['amount']
+    if amount < priced_item['market_min']:
+        rendered['deviation'] = f"{-priced_item['deviation_pct']:.0f}% below average"
+    elif amount > priced_item['market_max']:
+        rendered['deviation'] = f"{priced_item['deviation_pct']:.0f}% above average"
+    
+    return rendered
+
+
+# Weights of the component scores in the overall budget score
+REASONABILITY_WEIGHT = 0.30
+MARKET_ALIGNMENT_WEIGHT = 0.25
+COMPLETENESS_WEIGHT = 0.25
+RED_FLAGS_WEIGHT = 0.20
+
+
+def score_budgets_batch(
+    reasonability_scores: Sequence[float],
+    market_scores: Sequence[float],
+    completeness_scores: Sequence[float],
+    red_flag_penalties: Sequence[float]
+) -> List[int]:
+    """
+    Compute overall budget scores for many proposals at once
+    
+    Args:
+        reasonability_scores: Reasonability score (0-100) per proposal
+        market_scores: Market alignment score (0-100) per proposal
+        completeness_scores: Completeness score (0-100) per proposal
+        red_flag_penalties: Sum of red flag risk_score values (<= 0) per proposal
+    
+    Returns:
+        Budget score (0-100) per proposal, in input order
+    """
+    scores = []
+    for reasonability, market, completeness, penalty in zip(
+        reasonability_scores, market_scores, completeness_scores, red_flag_penalties
+    ):
+        red_flag_score = max(0, 100 + penalty)  # Start at 100, subtract penalties
+        total = (
+            reasonability * REASONABILITY_WEIGHT +
+            market * MARKET_ALIGNMENT_WEIGHT +
+            completeness * COMPLETENESS_WEIGHT +
+            red_flag_score * RED_FLAGS_WEIGHT
+        )
+        scores.append(int(max(0, min(100, total))))  # Clamp to 0-100
+    return scores
+
+
+@dataclass(slots=True)
+class BudgetReasonability:
+    """Result of BudgetAnalyzer.check_budget_reasonability"""
+    is_reasonable: bool = True
+    total_score: float = 0
+    category_scores: Dict[str, float] = field(default_factory=dict)
+    issue_codes: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    warning_codes: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    # Rendered text, only filled in when render_messages is requested
+    issues: Optional[List[str]] = None
+    warnings: Optional[List[str]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        result = {
+            'is_reasonable': self.is_reasonable,
+            'total_score': self.total_score,
+            'category_scores': self.category_scores,
+            'issue_codes': self.issue_codes,
+            'warning_codes': self.warning_codes
+        }
+        if self.issues is not None:
+            result['issues'] = self.issues
+            result['warnings'] = self.warnings
+        return result
+
+
+@dataclass(slots=True)
+class MarketComparison:
+    """Result of BudgetAnalyzer.compare_market_rates"""
+    alignment_score: float = 0
+    overpriced_items: List[Dict[str, Any]] = field(default_factory=list)
+    underpriced_items: List[Dict[str, Any]] = field(default_factory=list)
+    reasonable_items: List[Dict[str, Any]] = field(default_factory=list)
+    missing_items: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'alignment_score': self.alignment_score,
+            'overpriced_items': self.overpriced_items,
+            'underpriced_items': self.underpriced_items,
+            'reasonable_items': self.reasonable_items,
+            'missing_items': self.missing_items
+        }
+
+
+@dataclass(slots=True)
+class BudgetRedFlag:
+    """A problem found by BudgetAnalyzer.detect_budget_red_flags"""
+    severity: str
+    category: str
+    flag: str
+    risk_score: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'severity': self.severity,
+            'category': self.category,
+            'flag': self.flag,
+            'risk_score': self.risk_score
+        }
+
+
+class BudgetItemsView(SequenceABC):
+    """
+    Read-only list-of-dicts view over a breakdown's column-wise item fields
+    
+    Keeps breakdown['items'] usable as before (indexing, iteration, len)
+    while the analyzer itself works on the per-field lists.
+    """
+    
+    __slots__ = ('_breakdown',)
+    
+    def __init__(self, breakdown: Dict[str, Any]):
+        self._breakdown = breakdown
+    
+    def __len__(self) -> int:
+        return len(self._breakdown['item_amounts'])
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        
+        breakdown = self._breakdown
+        return {
+            'category': breakdown['item_categories'][index],
+            'description': breakdown['item_descriptions'][index],
+            'amount': breakdown['item_amounts'][index],
+            'quantity': breakdown['item_quantities'][index],
+            'unit_cost': breakdown['item_unit_costs'][index]
+        }
+
+
+def _flatten_market_rates(
+    market_rates: Dict[str, Dict[str, Dict[str, int]]],
+    monthly: Tuple[str, ...]
+) -> Tuple[Dict[Tuple[str, str], int], Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...], Tuple[bool, ...]]]:
+    """
+    Flatten market rate benchmarks into id-indexed parallel tuples
+    
+    Args:
+        market_rates: {category: {sub_role: {'min', 'max', 'avg'}}}
+        monthly: Categories whose rates are per month rather than per project
+    
+    Returns:
+        Tuple of ({(category, sub_role): rate_id}, (mins, maxs, avgs, is_monthly))
+    """
+    rate_ids = {}
+    rows = []
+    for category, sub_roles in market_rates.items():
+        for sub_role, rate in sub_roles.items():
+            rate_ids[(category, sub_role)] = len(rows)
+            rows.append((rate['min'], rate['max'], rate['avg'], category in monthly))
+    
+    return rate_ids, tuple(zip(*rows))
+
+
+def _flatten_distributions(
+    distributions: Dict[str, Dict[str, Dict[str, int]]]
+) -> Dict[str, Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]]:
+    """
+    Flatten category distributions into parallel range tuples per project type
+    
+    Each category's range for a project type is resolved once here, falling
+    back to its 'software' range (or its first listed range) when that type is
+    missing, so scoring never walks the nested dicts.
+    
+    Args:
+        distributions: {category: {project_type: {'min', 'max', 'recommended'}}}
+    
+    Returns:
+        {project_type: (mins, maxs, recommendeds)} in distributions' category order
+    """
+    project_types = {pt for category_types in distributions.values() for pt in category_types}
+    arrays = {}
+    for project_type in project_types:
+        ranges = [
+            category_types.get(
+                project_type,
+                category_types.get('software', next(iter(category_types.values())))
+            )
+            for category_types in distributions.values()
+        ]
+        arrays[project_type] = (
+            tuple(r['min'] for r in ranges),
+            tuple(r['max'] for r in ranges),
+            tuple(r['recommended'] for r in ranges)
+        )
+    return arrays
+
+
+# Market rate benchmarks (USD per month or per project)
+MARKET_RATES = {
+    'developer': {
+        'junior': {'min': 3000, 'max': 6000, 'avg': 4500},
+        'mid': {'min': 6000, 'max': 10000, 'avg': 8000},
+        'senior': {'min': 10000, 'max': 20000, 'avg': 15000},
+        'lead': {'min': 15000, 'max': 30000, 'avg': 22000}
+    },
+    'designer': {
+        'junior': {'min': 2500, 'max': 5000, 'avg': 3500},
+        'mid': {'min': 5000, 'max': 8000, 'avg': 6500},
+        'senior': {'min': 8000, 'max': 15000, 'avg': 11000}
+    },
+    'marketing': {
+        'social_media': {'min': 1000, 'max': 5000, 'avg': 3000},
+        'content_creation': {'min': 2000, 'max': 8000, 'avg': 5000},
+        'campaign': {'min': 5000, 'max': 50000, 'avg': 20000}
+    },
+    'audit': {
+        'smart_contract': {'min': 10000, 'max': 100000, 'avg': 40000},
+        'security': {'min': 5000, 'max': 50000, 'avg': 20000}
+    },
+    'infrastructure': {
+        'hosting': {'min': 100, 'max': 2000, 'avg': 500},
+        'domain': {'min': 10, 'max': 100, 'avg': 30},
+        'services': {'min': 500, 'max': 5000, 'avg': 2000}
+    }
+}
+
+# Recommended budget category distributions (percentages)
+CATEGORY_DISTRIBUTIONS = {
+    'development': {
+        'software': {'min': 40, 'max': 60, 'recommended': 50},
+        'infrastructure': {'min': 35, 'max': 55, 'recommended': 45},
+        'research': {'min': 30, 'max': 50, 'recommended': 40}
+    },
+    'marketing': {
+        'software': {'min': 10, 'max': 20, 'recommended': 15},
+        'infrastructure': {'min': 15, 'max': 25, 'recommended': 20},
+        'research': {'min': 5, 'max': 15, 'recommended': 10}
+    },
+    'operations': {
+        'software': {'min': 10, 'max': 20, 'recommended': 15},
+        'infrastructure': {'min': 15, 'max': 25, 'recommended': 20},
+        'research': {'min': 10, 'max': 20, 'recommended': 15}
+    },
+    'audits': {
+        'software': {'min': 5, 'max': 15, 'recommended': 10},
+        'infrastructure': {'min': 5, 'max': 15, 'recommended': 10},
+        'research': {'min': 3, 'max': 10, 'recommended': 5}
+    },
+    'contingency': {
+        'software': {'min': 5, 'max': 15, 'recommended': 10},
+        'infrastructure': {'min': 5, 'max': 15, 'recommended': 10},
+        'research': {'min': 5, 'max': 15, 'recommended': 10}
+    }
+}
+
+# Flattened benchmark tables, built once at import:
+# (category, sub-role) -> rate id, with parallel min/max/avg/is-monthly tuples
+# indexed by that id, and per-project-type category range tuples
+_RATE_IDS, (_RATE_MINS, _RATE_MAXS, _RATE_AVGS, _RATE_IS_MONTHLY) = _flatten_market_rates(
+    MARKET_RATES, monthly=('developer', 'designer')
+)
+_CATEGORY_KEYS = tuple(CATEGORY_DISTRIBUTIONS)
+_DISTRIBUTION_ARRAYS = _flatten_distributions(CATEGORY_DISTRIBUTIONS)
+
 
 class BudgetAnalyzer:
     """
@@ -32,68 +404,38 @@ class BudgetAnalyzer:
     Scoring: 0-100 (higher = better budget quality)
     """
     
-    # Market rate benchmarks (USD per month or per project)
-    MARKET_RATES = {
-        'developer': {
-            'junior': {'min': 3000, 'max': 6000, 'avg': 4500},
-            'mid': {'min': 6000, 'max': 10000, 'avg': 8000},
-            'senior': {'min': 10000, 'max': 20000, 'avg': 15000},
-            'lead': {'min': 15000, 'max': 30000, 'avg': 22000}
-        },
-        'designer': {
-            'junior': {'min': 2500, 'max': 5000, 'avg': 3500},
-            'mid': {'min': 5000, 'max': 8000, 'avg': 6500},
-            'senior': {'min': 8000, 'max': 15000, 'avg': 11000}
-        },
-        'marketing': {
-            'social_media': {'min': 1000, 'max': 5000, 'avg': 3000},
-            'content_creation': {'min': 2000, 'max': 8000, 'avg': 5000},
-            'campaign': {'min': 5000, 'max': 50000, 'avg': 20000}
-        },
-        'audit': {
-            'smart_contract': {'min': 10000, 'max': 100000, 'avg': 40000},
-            'security': {'min': 5000, 'max': 50000, 'avg': 20000}
-        },
-        'infrastructure': {
-            'hosting': {'min': 100, 'max': 2000, 'avg': 500},
-            'domain': {'min': 10, 'max': 100, 'avg': 30},
-            'services': {'min': 500, 'max': 5000, 'avg': 2000}
-        }
-    }
+    # Benchmarks live at module level; kept here for existing references
+    MARKET_RATES = MARKET_RATES
+    CATEGORY_DISTRIBUTIONS = CATEGORY_DISTRIBUTIONS
     
-    # Recommended budget category distributions (percentages)
-    CATEGORY_DISTRIBUTIONS = {
-        'development': {
-            'software': {'min': 40, 'max': 60, 'recommended': 50},
-            'infrastructure': {'min': 35, 'max': 55, 'recommended': 45},
-            'research': {'min': 30, 'max': 50, 'recommended': 40}
-        },
-        'marketing': {
-            'software': {'min': 10, 'max': 20, 'recommended': 15},
-            'infrastructure': {'min': 15, 'max': 25, 'recommended': 20},
-            'research': {'min': 5, 'max': 15, 'recommended': 10}
-        },
-        'operations': {
-            'software': {'min': 10, 'max': 20, 'recommended': 15},
-            'infrastructure': {'min': 15, 'max': 25, 'recommended': 20},
-            'research': {'min': 10, 'max': 20, 'recommended': 15}
-        },
-        'audits': {
-            'software': {'min': 5, 'max': 15, 'recommended': 10},
-            'infrastructure': {'min': 5, 'max': 15, 'recommended': 10},
-            'research': {'min': 3, 'max': 10, 'recommended': 5}
-        },
-        'contingency': {
-            'software': {'min': 5, 'max': 15, 'recommended': 10},
-            'infrastructure': {'min': 5, 'max': 15, 'recommended': 10},
-            'research': {'min': 5, 'max': 15, 'recommended': 10}
-        }
-    }
+    # Most recent analyze_budget results kept per analyzer instance
+    RESULT_CACHE_SIZE = 256
     
     def __init__(self):
         """Initialize Budget Analyzer"""
+        # analyze_budget is deterministic in its inputs, so repeat requests for an
+        # unchanged proposal (dashboard refreshes, re-polls) are served from an LRU
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         logger.info("BudgetAnalyzer initialized")
     
+    def _cache_key(
+        self,
+        grant_id: str,
+        budget_data: Dict[str, Any],
+        project_type: str,
+        deliverables: Optional[List[str]]
+    ) -> str:
+        """Hash the canonical JSON form of analyze_budget's inputs"""
+        canonical = json.dumps(
+            [grant_id, budget_data, project_type, deliverables or []],
+            sort_keys=True,
+            separators=(',', ':'),
+            default=str
+        )
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    
     def parse_budget_breakdown(self, budget_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse and normalize budget breakdown
@@ -109,7 +451,22 @@ class BudgetAnalyzer:
             'currency': budget_data.get('currency', 'USD'),
             'duration_months': int(budget_data.get('duration_months', 6)),
             'categories': {},
-            'items': []
+            # Items are stored column-wise (one list per field, same index per
+            # item); breakdown['items'] is a read-only per-item view over them
+            'item_categories': [],
+            'item_descriptions': [],
+            'item_amounts': [],
+            'item_quantities': [],
+            'item_unit_costs': [],
+            # Market-rate id per item (-1 = no match), resolved once for compare_market_rates
+            'item_rates': [],
+            # ITEM_* description flags per item, tested once here
+            'item_flags': [],
+            # Item facts the later stages need, gathered in this single pass
+            # so they don't each walk the items again
+            'vague_count': 0,
+            'has_contingency': False,
+            'mentions_contingency': False
         }
         
         # Parse budget items
@@ -123,39 +480,71 @@ class BudgetAnalyzer:
                 breakdown['categories'][category] = 0
             breakdown['categories'][category] += amount
             
+            description = item.get('description', '')
+            description_lc = description.lower()
+            
+            flags = 0
+            if _VAGUE_TERM_RE.search(description_lc):
+                flags |= ITEM_VAGUE
+                breakdown['vague_count'] += 1
+            if _CONTINGENCY_RE.search(description_lc):
+                flags |= ITEM_CONTINGENCY
+                breakdown['has_contingency'] = True
+                if 'contingency' in description_lc:
+                    flags |= ITEM_MENTIONS_CONTINGENCY
+                    breakdown['mentions_contingency'] = True
+            
             # Add item details
-            breakdown['items'].append({
-                'category': category,
-                'description': item.get('description', ''),
-                'amount': amount,
-                'quantity': item.get('quantity', 1),
-                'unit_cost': item.get('unit_cost', amount)
-            })
+            breakdown['item_categories'].append(category)
+            breakdown['item_descriptions'].append(description)
+            breakdown['item_amounts'].append(amount)
+            breakdown['item_quantities'].append(item.get('quantity', 1))
+            breakdown['item_unit_costs'].append(item.get('unit_cost', amount))
+            breakdown['item_rates'].append(
+                _RATE_IDS.get(self._classify_market_rate(description_lc), -1)
+            )
+            breakdown['item_flags'].append(flags)
+        
+        breakdown['items'] = BudgetItemsView(breakdown)
+        
+        # Category facts only depend on which categories occur, and the keys of
+        # breakdown['categories'] are already that de-duplicated set, so resolve
+        # them once per distinct category rather than once per item
+        category_present = [False] * len(BudgetCategory)
+        for category in breakdown['categories']:
+            category_present[_CATEGORY_IDS.get(category, BudgetCategory.OTHER)] = True
+            if 'contingency' in category:
+                breakdown['mentions_contingency'] = True
+        breakdown['category_present'] = category_present
+        
+        breakdown['has_development'] = category_present[BudgetCategory.DEVELOPMENT]
+        breakdown['has_audit'] = (
+            category_present[BudgetCategory.AUDITS] or category_present[BudgetCategory.SECURITY]
+        )
+        breakdown['has_marketing'] = category_present[BudgetCategory.MARKETING]
         
         return breakdown
     
     def check_budget_reasonability(
         self,
         breakdown: Dict[str, Any],
-        project_type: str = 'software'
-    ) -> Dict[str, Any]:
+        project_type: str = 'software',
+        render_messages: bool = True
+    ) -> BudgetReasonability:
         """
         Check if budget amounts are reasonable
         
         Args:
             breakdown: Parsed budget breakdown
             project_type: Type of project (software, infrastructure, research)
+            render_messages: Also render 'issues' / 'warnings' text (default: True).
+                Scoring-only callers can pass False and use the structured
+                'issue_codes' / 'warning_codes' with render_issues() if needed.
         
         Returns:
             Reasonability analysis results
         """
-        analysis = {
-            'is_reasonable': True,
-            'total_score': 0,
-            'category_scores': {},
-            'issues': [],
-            'warnings': []
-        }
+        analysis = BudgetReasonability()
         
         total_amount = breakdown['total_amount']
         duration_months = breakdown['duration_months']
@@ -166,75 +555,115 @@ class BudgetAnalyzer:
         max_reasonable = duration_months * 100000  # $100k/month maximum
         
         if total_amount < min_reasonable:
-            analysis['issues'].append(
-                f"Budget seems too low: ${total_amount:,.0f} for {duration_months} months "
-                f"(minimum recommended: ${min_reasonable:,.0f})"
-            )
-            analysis['is_reasonable'] = False
+            analysis.issue_codes.append(('budget_too_low', {
+                'total': total_amount, 'months': duration_months, 'limit': min_reasonable
+            }))
+            analysis.is_reasonable = False
         elif total_amount > max_reasonable:
-            analysis['issues'].append(
-                f"Budget seems unreasonably high: ${total_amount:,.0f} for {duration_months} months "
-                f"(maximum reasonable: ${max_reasonable:,.0f})"
-            )
-            analysis['is_reasonable'] = False
-        
-        # Calculate category percentages
-        category_percentages = {}
-        for category, amount in categories.items():
-            if total_amount > 0:
-                percentage = (amount / total_amount) * 100
-                category_percentages[category] = percentage
+            analysis.issue_codes.append(('budget_too_high', {
+                'total': total_amount, 'months': duration_months, 'limit': max_reasonable
+            }))
+            analysis.is_reasonable = False
         
         # Check category distributions
-        # Get distributions for project type, default to first available type
-        if project_type in ['software', 'infrastructure', 'research']:
-            distributions = self.CATEGORY_DISTRIBUTIONS
+        # Get distributions for project type, default to software ranges
+        mins, maxs, recs = _DISTRIBUTION_ARRAYS.get(
+            project_type, _DISTRIBUTION_ARRAYS['software']
+        )
+        
+        # Category percentages, in the same order as the range tuples
+        if total_amount > 0:
+            percentages = [categories.get(key, 0) / total_amount * 100 for key in _CATEGORY_KEYS]
         else:
-            distributions = self.CATEGORY_DISTRIBUTIONS
-        
-        for expected_category, category_types in distributions.items():
-            # Get the ranges for this project type
-            ranges = category_types.get(project_type, category_types.get('software', category_types.get(list(category_types.keys())[0])))
-            actual_percentage = category_percentages.get(expected_category, 0)
-            min_pct = ranges['min']
-            max_pct = ranges['max']
-            recommended_pct = ranges['recommended']
-            
+            percentages = [0] * len(_CATEGORY_KEYS)
+        
+        category_scores = analysis.category_scores
+        score_sum = 0
+        score_count = 0
+        for expected_category, actual_percentage, min_pct, max_pct, recommended_pct in zip(
+            _CATEGORY_KEYS, percentages, mins, maxs, recs
+        ):
             # Score this category (0-100)
             if actual_percentage == 0:
                 score = 0
-                analysis['issues'].append(
-                    f"Missing {expected_category} budget (recommended: {recommended_pct}% or "
-                    f"${total_amount * recommended_pct / 100:,.0f})"
-                )
+                analysis.issue_codes.append(('category_missing', {
+                    'category': expected_category,
+                    'recommended': recommended_pct,
+                    'amount': total_amount * recommended_pct / 100
+                }))
             elif actual_percentage < min_pct:
                 score = 30
-                analysis['warnings'].append(
-                    f"{expected_category.title()} budget is low: {actual_percentage:.1f}% "
-                    f"(recommended: {recommended_pct}%)"
-                )
+                analysis.warning_codes.append(('category_low', {
+                    'category': expected_category,
+                    'percentage': actual_percentage,
+                    'recommended': recommended_pct
+                }))
             elif actual_percentage > max_pct:
                 score = 50
-                analysis['warnings'].append(
-                    f"{expected_category.title()} budget is high: {actual_percentage:.1f}% "
-                    f"(recommended: {recommended_pct}%)"
-                )
+                analysis.warning_codes.append(('category_high', {
+                    'category': expected_category,
+                    'percentage': actual_percentage,
+                    'recommended': recommended_pct
+                }))
             else:
                 # Calculate score based on proximity to recommended
                 deviation = abs(actual_percentage - recommended_pct) / recommended_pct
                 score = max(70, 100 - (deviation * 100))
             
-            analysis['category_scores'][expected_category] = score
+            category_scores[expected_category] = score
+            score_sum += score
+            score_count += 1
         
         # Calculate overall score
-        if analysis['category_scores']:
-            analysis['total_score'] = sum(analysis['category_scores'].values()) / len(analysis['category_scores'])
-        else:
-            analysis['total_score'] = 0
+        analysis.total_score = score_sum / score_count if score_count else 0
+        
+        if render_messages:
+            analysis.issues = render_issues(analysis.issue_codes)
+            analysis.warnings = render_issues(analysis.warning_codes)
         
         return analysis
     
-    def compare_market_rates(self, breakdown: Dict[str, Any]) -> Dict[str, Any]:
+    def _classify_market_rate(self, description: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Match a lowercased item description to a MARKET_RATES entry
+        
+        Args:
+            description: Lowercased item description
+        
+        Returns:
+            Tuple of (rate category, sub-role), or (None, None) if nothing matches
+        """
+        # Check developer rates
+        if _DEVELOPER_RE.search(description):
+            if _SENIOR_OR_LEAD_RE.search(description):
+                return 'developer', 'senior'
+            if 'junior' in description:
+                return 'developer', 'junior'
+            return 'developer', 'mid'
+        
+        # Check designer rates
+        if _DESIGNER_RE.search(description):
+            return 'designer', 'senior' if 'senior' in description else 'mid'
+        
+        # Check audit rates ('contract' also covers 'smart contract')
+        if _AUDIT_RE.search(description):
+            return 'audit', 'smart_contract' if 'contract' in description else 'security'
+        
+        # Check marketing rates
+        if _MARKETING_RE.search(description):
+            if 'campaign' in description:
+                return 'marketing', 'campaign'
+            if 'content' in description:
+                return 'marketing', 'content_creation'
+            return 'marketing', 'social_media'
+        
+        # Check infrastructure rates
+        if _INFRASTRUCTURE_RE.search(description):
+            return 'infrastructure', 'hosting'
+        
+        return None, None
+    
+    def compare_market_rates(self, breakdown: Dict[str, Any]) -> MarketComparison:
         """
         Compare budget items with market rates
         
@@ -244,165 +673,96 @@ class BudgetAnalyzer:
         Returns:
             Market rate comparison results
         """
-        comparison = {
-            'alignment_score': 0,
-            'overpriced_items': [],
-            'underpriced_items': [],
-            'reasonable_items': [],
-            'missing_items': []
-        }
+        comparison = MarketComparison()
         
         total_items_checked = 0
         total_alignment_score = 0
         
+        duration = breakdown.get('duration_months', 1)
+        
         # Check each budget item
-        for item in breakdown['items']:
-            description = item['description'].lower()
-            amount = item['amount']
-            category = item['category']
-            
-            # Try to match with market rates
-            matched_rate = None
-            rate_category = None
-            
-            # Check developer rates
-            if any(word in description for word in ['developer', 'engineer', 'programmer', 'dev']):
-                rate_category = 'developer'
-                if 'senior' in description or 'lead' in description:
-                    matched_rate = self.MARKET_RATES['developer']['senior']
-                elif 'junior' in description:
-                    matched_rate = self.MARKET_RATES['developer']['junior']
-                else:
-                    matched_rate = self.MARKET_RATES['developer']['mid']
-            
-            # Check designer rates
-            elif any(word in description for word in ['designer', 'design', 'ui', 'ux']):
-                rate_category = 'designer'
-                if 'senior' in description:
-                    matched_rate = self.MARKET_RATES['designer']['senior']
-                else:
-                    matched_rate = self.MARKET_RATES['designer']['mid']
-            
-            # Check audit rates
-            elif any(word in description for word in ['audit', 'security review', 'penetration test']):
-                rate_category = 'audit'
-                if 'smart contract' in description or 'contract' in description:
-                    matched_rate = self.MARKET_RATES['audit']['smart_contract']
-                else:
-                    matched_rate = self.MARKET_RATES['audit']['security']
-            
-            # Check marketing rates
-            elif any(word in description for word in ['marketing', 'advertising', 'promotion']):
-                rate_category = 'marketing'
-                if 'campaign' in description:
-                    matched_rate = self.MARKET_RATES['marketing']['campaign']
-                elif 'content' in description:
-                    matched_rate = self.MARKET_RATES['marketing']['content_creation']
-                else:
-                    matched_rate = self.MARKET_RATES['marketing']['social_media']
-            
-            # Check infrastructure rates
-            elif any(word in description for word in ['hosting', 'server', 'cloud', 'infrastructure']):
-                rate_category = 'infrastructure'
-                matched_rate = self.MARKET_RATES['infrastructure']['hosting']
-            
+        for description, amount, rate_id in zip(
+            breakdown['item_descriptions'], breakdown['item_amounts'], breakdown['item_rates']
+        ):
             # Compare with market rate if matched
-            if matched_rate:
+            if rate_id >= 0:
                 total_items_checked += 1
                 
                 # Adjust for duration if applicable
-                duration = breakdown.get('duration_months', 1)
-                if rate_category in ['developer', 'designer']:
+                if _RATE_IS_MONTHLY[rate_id]:
                     # These are monthly rates
-                    expected_min = matched_rate['min'] * duration
-                    expected_max = matched_rate['max'] * duration
-                    expected_avg = matched_rate['avg'] * duration
+                    expected_min = _RATE_MINS[rate_id] * duration
+                    expected_max = _RATE_MAXS[rate_id] * duration
+                    expected_avg = _RATE_AVGS[rate_id] * duration
                 else:
                     # These are per-project rates
-                    expected_min = matched_rate['min']
-                    expected_max = matched_rate['max']
-                    expected_avg = matched_rate['avg']
+                    expected_min = _RATE_MINS[rate_id]
+                    expected_max = _RATE_MAXS[rate_id]
+                    expected_avg = _RATE_AVGS[rate_id]
+                
+                # Raw figures only; the display strings are rendered by
+                # render_market_item for the few items that reach the response
+                deviation_pct = (amount - expected_avg) / expected_avg * 100
+                priced_item = {
+                    'description': description,
+                    'amount': amount,
+                    'market_min': expected_min,
+                    'market_max': expected_max,
+                    'market_avg': expected_avg,
+                    'deviation_pct': deviation_pct
+                }
                 
                 # Calculate alignment score for this item
                 if amount < expected_min * 0.5:
                     # Severely underpriced
                     item_score = 20
-                    comparison['underpriced_items'].append({
-                        'description': item['description'],
-                        'amount': amount,
-                        'market_range': f"${expected_min:,.0f} - ${expected_max:,.0f}",
-                        'deviation': f"{((expected_avg - amount) / expected_avg * 100):.0f}% below average"
-                    })
+                    comparison.underpriced_items.append(priced_item)
                 elif amount < expected_min:
                     # Underpriced
                     item_score = 50
-                    comparison['underpriced_items'].append({
-                        'description': item['description'],
-                        'amount': amount,
-                        'market_range': f"${expected_min:,.0f} - ${expected_max:,.0f}",
-                        'deviation': f"{((expected_avg - amount) / expected_avg * 100):.0f}% below average"
-                    })
+                    comparison.underpriced_items.append(priced_item)
                 elif amount > expected_max * 2:
                     # Severely overpriced
                     item_score = 20
-                    comparison['overpriced_items'].append({
-                        'description': item['description'],
-                        'amount': amount,
-                        'market_range': f"${expected_min:,.0f} - ${expected_max:,.0f}",
-                        'deviation': f"{((amount - expected_avg) / expected_avg * 100):.0f}% above average"
-                    })
+                    comparison.overpriced_items.append(priced_item)
                 elif amount > expected_max:
                     # Overpriced
                     item_score = 50
-                    comparison['overpriced_items'].append({
-                        'description': item['description'],
-                        'amount': amount,
-                        'market_range': f"${expected_min:,.0f} - ${expected_max:,.0f}",
-                        'deviation': f"{((amount - expected_avg) / expected_avg * 100):.0f}% above average"
-                    })
+                    comparison.overpriced_items.append(priced_item)
                 else:
                     # Within reasonable range
                     # Calculate score based on proximity to average
-                    deviation = abs(amount - expected_avg) / expected_avg
-                    item_score = max(70, 100 - (deviation * 100))
-                    comparison['reasonable_items'].append({
-                        'description': item['description'],
-                        'amount': amount,
-                        'market_range': f"${expected_min:,.0f} - ${expected_max:,.0f}"
-                    })
+                    item_score = max(70, 100 - abs(deviation_pct))
+                    comparison.reasonable_items.append(priced_item)
                 
                 total_alignment_score += item_score
         
         # Calculate overall alignment score
         if total_items_checked > 0:
-            comparison['alignment_score'] = total_alignment_score / total_items_checked
+            comparison.alignment_score = total_alignment_score / total_items_checked
         else:
-            comparison['alignment_score'] = 50  # Default if no items could be checked
+            comparison.alignment_score = 50  # Default if no items could be checked
         
         # Check for missing critical items
-        has_development = any(item['category'] == 'development' for item in breakdown['items'])
-        has_audit = any(item['category'] in ['audit', 'audits', 'security'] for item in breakdown['items'])
-        has_marketing = any(item['category'] == 'marketing' for item in breakdown['items'])
-        
-        if not has_development and breakdown['total_amount'] > 10000:
-            comparison['missing_items'].append("No development costs specified")
+        if not breakdown['has_development'] and breakdown['total_amount'] > 10000:
+            comparison.missing_items.append("No development costs specified")
         
-        if not has_audit and breakdown['total_amount'] > 50000:
-            comparison['missing_items'].append(
+        if not breakdown['has_audit'] and breakdown['total_amount'] > 50000:
+            comparison.missing_items.append(
                 "No security audit budgeted for project over $50k (recommended: $10k-$40k)"
             )
         
-        if not has_marketing and breakdown['total_amount'] > 20000:
-            comparison['missing_items'].append("No marketing budget specified")
+        if not breakdown['has_marketing'] and breakdown['total_amount'] > 20000:
+            comparison.missing_items.append("No marketing budget specified")
         
         return comparison
     
     def detect_budget_red_flags(
         self,
         breakdown: Dict[str, Any],
-        reasonability: Dict[str, Any],
-        market_comparison: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+        reasonability: BudgetReasonability,
+        market_comparison: MarketComparison
+    ) -> List[BudgetRedFlag]:
         """
         Detect red flags in budget
         
@@ -421,85 +781,78 @@ class BudgetAnalyzer:
         
         # Red flag: Extremely high or low total
         if total_amount > 500000:
-            red_flags.append({
-                'severity': 'high',
-                'category': 'total_amount',
-                'flag': f"Unusually high budget request: ${total_amount:,.0f}",
-                'risk_score': -20
-            })
+            red_flags.append(BudgetRedFlag(
+                severity='high',
+                category='total_amount',
+                flag=f"Unusually high budget request: ${total_amount:,.0f}",
+                risk_score=-20
+            ))
         elif total_amount < 5000:
-            red_flags.append({
-                'severity': 'high',
-                'category': 'total_amount',
-                'flag': f"Unrealistically low budget: ${total_amount:,.0f}",
-                'risk_score': -20
-            })
+            red_flags.append(BudgetRedFlag(
+                severity='high',
+                category='total_amount',
+                flag=f"Unrealistically low budget: ${total_amount:,.0f}",
+                risk_score=-20
+            ))
         
         # Red flag: Missing essential categories
         if not categories.get('development', 0) and total_amount > 10000:
-            red_flags.append({
-                'severity': 'high',
-                'category': 'completeness',
-                'flag': "No development budget for technical project",
-                'risk_score': -25
-            })
+            red_flags.append(BudgetRedFlag(
+                severity='high',
+                category='completeness',
+                flag="No development budget for technical project",
+                risk_score=-25
+            ))
         
         # Red flag: Overpriced items
-        if len(market_comparison['overpriced_items']) > 3:
-            red_flags.append({
-                'severity': 'medium',
-                'category': 'market_alignment',
-                'flag': f"{len(market_comparison['overpriced_items'])} items significantly above market rates",
-                'risk_score': -15
-            })
+        if len(market_comparison.overpriced_items) > 3:
+            red_flags.append(BudgetRedFlag(
+                severity='medium',
+                category='market_alignment',
+                flag=f"{len(market_comparison.overpriced_items)} items significantly above market rates",
+                risk_score=-15
+            ))
         
         # Red flag: Poor category distribution
-        if reasonability['total_score'] < 40:
-            red_flags.append({
-                'severity': 'medium',
-                'category': 'distribution',
-                'flag': "Poor budget distribution across categories",
-                'risk_score': -10
-            })
+        if reasonability.total_score < 40:
+            red_flags.append(BudgetRedFlag(
+                severity='medium',
+                category='distribution',
+                flag="Poor budget distribution across categories",
+                risk_score=-10
+            ))
         
         # Red flag: Too much in one category
         if total_amount > 0:
             for category, amount in categories.items():
                 percentage = (amount / total_amount) * 100
                 if percentage > 70:
-                    red_flags.append({
-                        'severity': 'medium',
-                        'category': 'distribution',
-                        'flag': f"{category.title()} takes {percentage:.0f}% of budget (too concentrated)",
-                        'risk_score': -10
-                    })
+                    red_flags.append(BudgetRedFlag(
+                        severity='medium',
+                        category='distribution',
+                        flag=f"{category.title()} takes {percentage:.0f}% of budget (too concentrated)",
+                        risk_score=-10
+                    ))
         
         # Red flag: Vague or duplicate items
-        descriptions = [item['description'].lower() for item in breakdown['items']]
-        vague_terms = ['miscellaneous', 'other', 'various', 'expenses', 'costs']
-        vague_count = sum(1 for desc in descriptions if any(term in desc for term in vague_terms))
+        vague_count = breakdown['vague_count']
         
         if vague_count > 2:
-            red_flags.append({
-                'severity': 'low',
-                'category': 'clarity',
-                'flag': f"{vague_count} vague budget items (need more specific descriptions)",
-                'risk_score': -5
-            })
+            red_flags.append(BudgetRedFlag(
+                severity='low',
+                category='clarity',
+                flag=f"{vague_count} vague budget items (need more specific descriptions)",
+                risk_score=-5
+            ))
         
         # Red flag: No contingency buffer
-        has_contingency = any(
-            'contingency' in item['description'].lower() or 'buffer' in item['description'].lower()
-            for item in breakdown['items']
-        )
-        
-        if not has_contingency and total_amount > 20000:
-            red_flags.append({
-                'severity': 'low',
-                'category': 'planning',
-                'flag': "No contingency buffer (recommended: 10% of budget)",
-                'risk_score': -5
-            })
+        if not breakdown['has_contingency'] and total_amount > 20000:
+            red_flags.append(BudgetRedFlag(
+                severity='low',
+                category='planning',
+                flag="No contingency buffer (recommended: 10% of budget)",
+                risk_score=-5
+            ))
         
         return red_flags
     
@@ -544,13 +897,19 @@ class BudgetAnalyzer:
             # Even distribution for 5+ milestones
             distributions = [1.0 / num_milestones] * num_milestones
         
+        # Work in whole cents so the milestone amounts add up to the total
+        # exactly; the last milestone absorbs the rounding remainder
+        total_cents = round(total_amount * 100)
+        milestone_cents = [round(total_cents * distribution) for distribution in distributions[:-1]]
+        milestone_cents.append(total_cents - sum(milestone_cents))
+        
         # Create milestone structure
         months_per_milestone = timeline_months / num_milestones
         current_month = 0
         
         for i, distribution in enumerate(distributions):
             milestone_num = i + 1
-            amount = total_amount * distribution
+            cents = milestone_cents[i]
             target_month = int((i + 1) * months_per_milestone)
             
             # Assign deliverables to milestones
@@ -569,7 +928,7 @@ class BudgetAnalyzer:
             milestone = {
                 'milestone_number': milestone_num,
                 'title': f"Milestone {milestone_num}: {phase}",
-                'amount': round(amount, 2),
+                'amount': cents / 100,
                 'percentage': round(distribution * 100, 1),
                 'target_month': target_month,
                 'deliverables': milestone_deliverables if milestone_deliverables else [
@@ -582,11 +941,28 @@ class BudgetAnalyzer:
         
         return milestones
     
+    def _budget_confidence(
+        self,
+        reasonability: BudgetReasonability,
+        market_comparison: MarketComparison,
+        red_flags: List[BudgetRedFlag]
+    ) -> float:
+        """Confidence (0-1) in a budget score, from how much evidence backed it"""
+        confidence = 0.7  # Base confidence
+        if len(market_comparison.reasonable_items) > 3:
+            confidence += 0.15
+        if len(red_flags) == 0:
+            confidence += 0.10
+        if reasonability.total_score > 70:
+            confidence += 0.05
+        
+        return min(confidence, 1.0)
+    
     def calculate_budget_score(
         self,
-        reasonability: Dict[str, Any],
-        market_comparison: Dict[str, Any],
-        red_flags: List[Dict[str, Any]],
+        reasonability: BudgetReasonability,
+        market_comparison: MarketComparison,
+        red_flags: List[BudgetRedFlag],
         completeness_score: float
     ) -> Tuple[int, float]:
         """
@@ -601,92 +977,64 @@ class BudgetAnalyzer:
         Returns:
             Tuple of (budget_score 0-100, confidence 0-1)
         """
-        # Weighted scoring
-        weights = {
-            'reasonability': 0.30,
-            'market_alignment': 0.25,
-            'completeness': 0.25,
-            'red_flags': 0.20
-        }
-        
-        # Calculate component scores
-        reasonability_score = reasonability.get('total_score', 0)
-        market_score = market_comparison.get('alignment_score', 50)
-        
         # Red flags penalty
-        red_flag_penalty = sum(flag.get('risk_score', 0) for flag in red_flags)
-        red_flag_score = max(0, 100 + red_flag_penalty)  # Start at 100, subtract penalties
-        
-        # Calculate weighted score
-        total_score = (
-            reasonability_score * weights['reasonability'] +
-            market_score * weights['market_alignment'] +
-            completeness_score * weights['completeness'] +
-            red_flag_score * weights['red_flags']
-        )
-        
-        total_score = max(0, min(100, total_score))  # Clamp to 0-100
-        
-        # Calculate confidence
-        confidence = 0.7  # Base confidence
-        if len(market_comparison['reasonable_items']) > 3:
-            confidence += 0.15
-        if len(red_flags) == 0:
-            confidence += 0.10
-        if reasonability_score > 70:
-            confidence += 0.05
+        red_flag_penalty = sum(flag.risk_score for flag in red_flags)
         
-        confidence = min(confidence, 1.0)
+        total_score = score_budgets_batch(
+            [reasonability.total_score],
+            [market_comparison.alignment_score],
+            [completeness_score],
+            [red_flag_penalty]
+        )[0]
         
-        return int(total_score), confidence
+        return total_score, self._budget_confidence(reasonability, market_comparison, red_flags)
     
-    def analyze_budget(
-        self,
-        grant_id: str,
-        budget_data: Dict[str, Any],
-        project_type: str = 'software',
-        deliverables: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
-        """
-        Perform comprehensive budget analysis
-        
-        Args:
-            grant_id: Grant proposal ID
-            budget_data: Budget information
-            project_type: Type of project
-            deliverables: List of project deliverables
-        
-        Returns:
-            Complete budget analysis results
-        """
-        start_time = time.time()
-        
-        logger.info(f"Starting budget analysis for grant {grant_id}")
-        
+    def _analyze_components(self, budget_data: Dict[str, Any], project_type: str) -> Dict[str, Any]:
+        """Run every per-proposal analysis stage that feeds the overall score"""
         # Parse budget breakdown
         breakdown = self.parse_budget_breakdown(budget_data)
         
         # Check reasonability
-        reasonability = self.check_budget_reasonability(breakdown, project_type)
+        # (issue text isn't part of the response, so don't render it)
+        reasonability = self.check_budget_reasonability(breakdown, project_type, render_messages=False)
         
         # Compare with market rates
         market_comparison = self.compare_market_rates(breakdown)
         
-        # Calculate completeness score
-        expected_categories = ['development', 'marketing', 'operations', 'audits']
-        present_categories = len([c for c in expected_categories if c in breakdown['categories']])
-        completeness_score = (present_categories / len(expected_categories)) * 100
+        # Calculate completeness score (development, marketing, operations, audits)
+        present_categories = sum(breakdown['category_present'][:_EXPECTED_CATEGORY_COUNT])
+        completeness_score = (present_categories / _EXPECTED_CATEGORY_COUNT) * 100
         
         # Detect red flags
         red_flags = self.detect_budget_red_flags(breakdown, reasonability, market_comparison)
         
-        # Calculate overall score
-        budget_score, confidence = self.calculate_budget_score(
-            reasonability,
-            market_comparison,
-            red_flags,
-            completeness_score
-        )
+        return {
+            'breakdown': breakdown,
+            'reasonability': reasonability,
+            'market_comparison': market_comparison,
+            'completeness_score': completeness_score,
+            'red_flags': red_flags,
+            'red_flag_penalty': sum(flag.risk_score for flag in red_flags)
+        }
+    
+    def _build_result(
+        self,
+        grant_id: str,
+        project_type: str,
+        deliverables: Optional[List[str]],
+        components: Dict[str, Any],
+        budget_score: int,
+        elapsed: float
+    ) -> Dict[str, Any]:
+        """Assemble the analyze_budget response for one scored proposal"""
+        start_time = time.perf_counter()
+        
+        breakdown = components['breakdown']
+        reasonability = components['reasonability']
+        market_comparison = components['market_comparison']
+        red_flags = components['red_flags']
+        
+        confidence = self._budget_confidence(reasonability, market_comparison, red_flags)
         
         # Generate milestone structure
         timeline_months = breakdown.get('duration_months', 6)
@@ -705,25 +1053,25 @@ class BudgetAnalyzer:
         else:
             recommendations.append("❌ Budget requires significant revision")
         
-        if market_comparison['overpriced_items']:
+        if market_comparison.overpriced_items:
             recommendations.append(
-                f"Review {len(market_comparison['overpriced_items'])} overpriced items"
+                f"Review {len(market_comparison.overpriced_items)} overpriced items"
             )
         
-        if market_comparison['underpriced_items']:
+        if market_comparison.underpriced_items:
             recommendations.append(
-                f"Consider increasing {len(market_comparison['underpriced_items'])} underpriced items"
+                f"Consider increasing {len(market_comparison.underpriced_items)} underpriced items"
             )
         
-        if market_comparison['missing_items']:
+        if market_comparison.missing_items:
             recommendations.extend([
-                f"Add: {item}" for item in market_comparison['missing_items'][:3]
+                f"Add: {item}" for item in market_comparison.missing_items[:3]
             ])
         
-        if not any('contingency' in str(item).lower() for item in breakdown['items']):
+        if not breakdown['mentions_contingency']:
             recommendations.append(f"Add 10% contingency buffer (${breakdown['total_amount'] * 0.1:,.0f})")
         
-        execution_time = time.time() - start_time
+        execution_time = elapsed + (time.perf_counter() - start_time)
         
         result = {
             'grant_id': grant_id,
@@ -733,27 +1081,133 @@ class BudgetAnalyzer:
             'total_amount': breakdown['total_amount'],
             'currency': breakdown['currency'],
             'duration_months': breakdown['duration_months'],
-            'reasonability_score': reasonability['total_score'],
-            'market_alignment_score': market_comparison['alignment_score'],
-            'completeness_score': completeness_score,
+            'reasonability_score': reasonability.total_score,
+            'market_alignment_score': market_comparison.alignment_score,
+            'completeness_score': components['completeness_score'],
             'category_breakdown': breakdown['categories'],
-            'red_flags': red_flags,
-            'overpriced_items': market_comparison['overpriced_items'][:5],
-            'underpriced_items': market_comparison['underpriced_items'][:5],
-            'missing_items': market_comparison['missing_items'],
+            'red_flags': [flag.to_dict() for flag in red_flags],
+            'overpriced_items': [render_market_item(i) for i in market_comparison.overpriced_items[:5]],
+            'underpriced_items': [render_market_item(i) for i in market_comparison.underpriced_items[:5]],
+            'missing_items': market_comparison.missing_items,
             'recommendations': recommendations,
             'suggested_milestones': milestones,
             'metadata': {
                 'execution_time_seconds': round(execution_time, 2),
                 'analysis_timestamp': get_utc_now().isoformat(),
                 'project_type': project_type,
-                'items_analyzed': len(breakdown['items'])
+                'items_analyzed': len(breakdown['item_amounts'])
             }
         }
         
-        logger.info(f"Budget analysis complete for grant {grant_id}: score={budget_score}, quality={result['quality_level']}")
+        logger.info(
+            "Budget analysis complete for grant %s: score=%s, quality=%s",
+            grant_id, budget_score, result['quality_level']
+        )
         
         return result
+    
+    def analyze_budget(
+        self,
+        grant_id: str,
+        budget_data: Dict[str, Any],
+        project_type: str = 'software',
+        deliverables: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Perform comprehensive budget analysis
+        
+        Args:
+            grant_id: Grant proposal ID
+            budget_data: Budget information
+            project_type: Type of project
+            deliverables: List of project deliverables
+        
+        Returns:
+            Complete budget analysis results
+        """
+        return self.analyze_budgets([grant_id], [budget_data], [project_type], [deliverables])[0]
+    
+    def analyze_budgets(
+        self,
+        grant_ids: List[str],
+        budgets: List[Dict[str, Any]],
+        project_types: Optional[List[str]] = None,
+        deliverables_list: Optional[List[Optional[List[str]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many proposal budgets in one call
+        
+        Each proposal is analyzed exactly as analyze_budget would, but cached
+        results are looked up together and the overall scores of every
+        uncached proposal are computed in one score_budgets_batch call.
+        
+        Args:
+            grant_ids: Grant proposal IDs
+            budgets: Budget information per grant
+            project_types: Type of project per grant (default: software)
+            deliverables_list: Project deliverables per grant (optional)
+        
+        Returns:
+            Complete budget analysis results, in input order
+        """
+        count = len(grant_ids)
+        project_types = project_types or ['software'] * count
+        deliverables_list = deliverables_list or [None] * count
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        pending = []
+        
+        for index in range(count):
+            grant_id = grant_ids[index]
+            cache_key = self._cache_key(grant_id, budgets[index], project_types[index], deliverables_list[index])
+            with self._cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+            
+            if cached is not None:
+                logger.info("Budget analysis cache hit for grant %s", grant_id)
+                # Callers may mutate what they get back, so never hand out the cached dict
+                results[index] = copy.deepcopy(cached)
+            else:
+                pending.append((index, cache_key))
+        
+        if not pending:
+            return results
+        
+        analyzed = []
+        for index, cache_key in pending:
+            start_time = time.perf_counter()
+            logger.info("Starting budget analysis for grant %s", grant_ids[index])
+            components = self._analyze_components(budgets[index], project_types[index])
+            analyzed.append((index, cache_key, components, time.perf_counter() - start_time))
+        
+        # Score every uncached proposal in one pass
+        budget_scores = score_budgets_batch(
+            [c['reasonability'].total_score for _, _, c, _ in analyzed],
+            [c['market_comparison'].alignment_score for _, _, c, _ in analyzed],
+            [c['completeness_score'] for _, _, c, _ in analyzed],
+            [c['red_flag_penalty'] for _, _, c, _ in analyzed]
+        )
+        
+        for (index, cache_key, components, elapsed), budget_score in zip(analyzed, budget_scores):
+            result = self._build_result(
+                grant_ids[index],
+                project_types[index],
+                deliverables_list[index],
+                components,
+                budget_score,
+                elapsed
+            )
+            
+            with self._cache_lock:
+                self._result_cache[cache_key] = copy.deepcopy(result)
+                if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            
+            results[index] = result
+        
+        return results
 
 
 # ============================================================================
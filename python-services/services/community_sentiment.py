@@ -3,14 +3,21 @@ Community Sentiment Analyzer
 Analyzes community voting and sentiment on grant proposals
 """
 
+import bisect
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime, timedelta
+import threading
+from collections import Counter, OrderedDict
+from itertools import islice
+from typing import AbstractSet, Dict, Any, Callable, Collection, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from datetime import timedelta
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import json
 import math
 
 from config import settings
+from utils.common import get_utc_now
 
 
 # Helper functions
@@ -33,6 +40,9 @@ def safe_int(value: Any, default: int = 0) -> int:
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Votes read per chunk by aggregate_votes_iter
+VOTE_CHUNK_SIZE = 65536
+
 
 class VotingStrategy(str, Enum):
     """Voting weight calculation strategies"""
@@ -51,6 +61,407 @@ class SentimentLevel(str, Enum):
     STRONG_OPPOSITION = "strong_opposition"  # 0-19%
 
 
+@dataclass(slots=True, frozen=True)
+class VoteRecord:
+    """A single vote with its fields already coerced to their numeric types"""
+    voter_address: str
+    option: str
+    option_value: float = 50.0
+    token_balance: float = 0.0
+    reputation_score: int = 50
+    
+    @classmethod
+    def from_dict(cls, vote: Dict[str, Any]) -> "VoteRecord":
+        """Build a VoteRecord from a vote dict, applying the usual defaults"""
+        return cls(
+            voter_address=vote.get("voter_address"),
+            option=vote.get("option"),
+            option_value=safe_float(vote.get("option_value", 50)),
+            token_balance=safe_float(vote.get("token_balance", 0)),
+            reputation_score=safe_int(vote.get("reputation_score", 50))
+        )
+
+
+def _coerce_column(
+    values: List[Any],
+    convert: Callable[[Any], Any],
+    safe_convert: Callable[[Any], Any]
+) -> List[Any]:
+    """
+    Convert a whole column with one try block
+    
+    The common all-valid column is converted directly; only a column holding
+    a missing or malformed value pays for the per-value safe conversion.
+    """
+    try:
+        return [convert(value) for value in values]
+    except (ValueError, TypeError):
+        return [safe_convert(value) for value in values]
+
+
+def _option_value_lut(poll_options: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Option id -> option value (0-100) for a poll's options"""
+    return {option["id"]: safe_float(option.get("value", 50)) for option in poll_options}
+
+
+# Default 5-point scale, for polls created without custom options
+_DEFAULT_VOTE_OPTIONS = [
+    {"id": "strongly_approve", "label": "Strongly Approve", "value": 100},
+    {"id": "approve", "label": "Approve", "value": 75},
+    {"id": "neutral", "label": "Neutral", "value": 50},
+    {"id": "reject", "label": "Reject", "value": 25},
+    {"id": "strongly_reject", "label": "Strongly Reject", "value": 0}
+]
+
+# A vote's value is a function of its option alone, so votes don't need to
+# carry option_value: it is looked up here (or in the poll's own options).
+# Only votes on an option missing from the table fall back to their field
+_DEFAULT_OPTION_VALUES = _option_value_lut(_DEFAULT_VOTE_OPTIONS)
+
+
+def _vote_option_value(vote: Union[Dict[str, Any], VoteRecord]) -> float:
+    """A vote's own option_value field, coerced"""
+    if isinstance(vote, VoteRecord):
+        return vote.option_value
+    return safe_float(vote.get("option_value", 50))
+
+
+def _ingest_votes(
+    votes: Union[List[Dict[str, Any]], List[VoteRecord]],
+    option_value_lut: Dict[str, float] = _DEFAULT_OPTION_VALUES
+) -> Tuple[AbstractSet[str], List[str], List[float], List[float], List[int]]:
+    """
+    Split vote records into parallel columns
+    
+    Each column is gathered by its own comprehension, which runs well ahead
+    of a single loop appending to five lists. Voters are only ever counted,
+    so they are collected straight into a set rather than a per-vote column.
+    
+    Args:
+        votes: Vote dicts, or VoteRecords (whose fields need no coercion)
+        option_value_lut: Option id -> value for the poll (default: the
+            5-point scale). Option values are looked up from the chosen
+            option instead of read and coerced from every vote (votes on an
+            option missing from the table keep their own option_value)
+    
+    Returns:
+        (voters, options, option_values, token_balances, reputation_scores)
+    """
+    if votes and isinstance(votes[0], VoteRecord):
+        voters = {vote.voter_address for vote in votes}
+        options = [vote.option for vote in votes]
+        return (
+            voters,
+            options,
+            _lookup_option_values(options, option_value_lut, votes),
+            [vote.token_balance for vote in votes],
+            [vote.reputation_score for vote in votes]
+        )
+    
+    options = [vote.get("option") for vote in votes]
+    return (
+        {vote.get("voter_address") for vote in votes},
+        options,
+        _lookup_option_values(options, option_value_lut, votes),
+        _coerce_column([vote.get("token_balance", 0) for vote in votes], float, safe_float),
+        _coerce_column([vote.get("reputation_score", 50) for vote in votes], int, safe_int)
+    )
+
+
+def _lookup_option_values(
+    options: List[str],
+    option_value_lut: Dict[str, float],
+    votes: Union[List[Dict[str, Any]], List[VoteRecord]]
+) -> List[float]:
+    """Option value per vote from the poll's option table"""
+    try:
+        return [option_value_lut[option] for option in options]
+    except KeyError:
+        return [
+            option_value_lut[option] if option in option_value_lut else _vote_option_value(vote)
+            for option, vote in zip(options, votes)
+        ]
+
+
+def _decode_votes(raw_votes: Union[str, bytes]) -> Iterator[Dict[str, Any]]:
+    """
+    Decode serialized votes, one vote dict at a time
+    
+    Accepts a JSON array of vote objects, or NDJSON (one vote object per
+    line), which is decoded line by line as the votes are consumed.
+    """
+    if raw_votes.lstrip()[:1] in ("[", b"["):
+        yield from json.loads(raw_votes)
+        return
+    
+    for line in raw_votes.splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+
+# Reputation weight for each whole reputation score 0-100 (already within 0-1)
+_REPUTATION_WEIGHTS = {reputation: reputation / 100.0 for reputation in range(101)}
+
+# The kernels below clamp each weight w to 0-1 inline as
+#     w if 0.0 < w < 1.0 else (0.0 if w < 1.0 else 1.0)
+# which gives exactly max(0.0, min(1.0, w)) (NaN included) without two
+# builtin calls per vote
+
+def _token_weights(
+    token_balances: Sequence[float],
+    reputation_scores: Sequence[int],
+    total_tokens: float
+) -> List[float]:
+    """Linear token-weighted: weight = tokens / total_tokens"""
+    if total_tokens <= 0:
+        return [0.0] * len(token_balances)
+    return [
+        weight if 0.0 < (weight := tokens / total_tokens) < 1.0 else (0.0 if weight < 1.0 else 1.0)
+        for tokens in token_balances
+    ]
+
+
+def _quadratic_weights(
+    token_balances: Sequence[float],
+    reputation_scores: Sequence[int],
+    total_tokens: float
+) -> List[float]:
+    """Quadratic voting: weight = sqrt(tokens) / sqrt(total_tokens)"""
+    if total_tokens <= 0:
+        return [0.0] * len(token_balances)
+    sqrt = math.sqrt
+    sqrt_total = sqrt(total_tokens)
+    # Negative balances have no square root; they count as no weight
+    return [
+        0.0 if tokens < 0
+        else weight if 0.0 < (weight := sqrt(tokens) / sqrt_total) < 1.0
+        else (0.0 if weight < 1.0 else 1.0)
+        for tokens in token_balances
+    ]
+
+
+def _reputation_weights(
+    token_balances: Sequence[float],
+    reputation_scores: Sequence[int],
+    total_tokens: float
+) -> List[float]:
+    """Reputation-based: weight = reputation / 100"""
+    # Reputations are almost always whole numbers in 0-100, whose weight is
+    # a table lookup; anything else takes the clamped formula
+    return [
+        weight if (weight := _REPUTATION_WEIGHTS.get(reputation)) is not None
+        else weight if 0.0 < (weight := reputation / 100.0) < 1.0
+        else (0.0 if weight < 1.0 else 1.0)
+        for reputation in reputation_scores
+    ]
+
+
+def _hybrid_weights(
+    token_balances: Sequence[float],
+    reputation_scores: Sequence[int],
+    total_tokens: float
+) -> List[float]:
+    """Hybrid: 60% token-weighted + 40% reputation"""
+    if total_tokens <= 0:
+        return [
+            weight if 0.0 < (weight := 0.4 * (reputation / 100.0)) < 1.0 else (0.0 if weight < 1.0 else 1.0)
+            for reputation in reputation_scores
+        ]
+    return [
+        weight if 0.0 < (weight := (0.6 * (tokens / total_tokens)) + (0.4 * (reputation / 100.0))) < 1.0
+        else (0.0 if weight < 1.0 else 1.0)
+        for tokens, reputation in zip(token_balances, reputation_scores)
+    ]
+
+
+# Column weight function per strategy, each taking
+# (token_balances, reputation_scores, total_tokens) and returning one weight
+# (0.0 to 1.0) per vote. The strategy is resolved once per call and any
+# per-poll constant (e.g. sqrt of the supply) is computed once per column.
+_WEIGHT_FNS = {
+    VotingStrategy.ONE_TOKEN_ONE_VOTE: _token_weights,
+    VotingStrategy.QUADRATIC: _quadratic_weights,
+    VotingStrategy.REPUTATION: _reputation_weights,
+    VotingStrategy.HYBRID: _hybrid_weights
+}
+
+
+def _vote_weights(
+    token_balances: Sequence[float],
+    reputation_scores: Sequence[int],
+    voting_strategy: VotingStrategy,
+    total_tokens: float
+) -> List[float]:
+    """
+    Vote weights for a whole column of votes
+    
+    Returns:
+        Weight (0.0 to 1.0) per vote, in input order (0.0 for unknown strategies)
+    """
+    weight_fn = _WEIGHT_FNS.get(voting_strategy)
+    if weight_fn is None:
+        return [0.0] * len(token_balances)
+    return weight_fn(token_balances, reputation_scores, total_tokens)
+
+
+class _VoteTally:
+    """
+    Running vote totals that column chunks are folded into
+    
+    Everything accumulates in vote order, so folding a poll in one chunk or
+    many gives exactly the same totals.
+    """
+    
+    __slots__ = (
+        'total_votes', 'voters', 'total_weight', 'weighted_sum',
+        'total_tokens_voted', 'option_counts', 'option_weights'
+    )
+    
+    def __init__(self):
+        self.total_votes = 0
+        self.voters = set()
+        self.total_weight = 0
+        self.weighted_sum = 0
+        self.total_tokens_voted = 0
+        # Per-option dicts, keyed in order of first appearance
+        self.option_counts = Counter()
+        self.option_weights = {}
+    
+    def add(
+        self,
+        voters: Collection[str],
+        options: Sequence[str],
+        option_values: Sequence[float],
+        token_balances: Sequence[float],
+        weights: Sequence[float]
+    ) -> None:
+        """Fold a chunk of weighted votes into the totals"""
+        self.total_votes += len(option_values)
+        self.voters.update(voters)
+        self.total_tokens_voted = sum(token_balances, self.total_tokens_voted)
+        
+        # Counts are tallied by Counter in C; new options get a zero weight
+        # slot first, so the weight loop below has no membership branch
+        option_counts = self.option_counts
+        option_weights = self.option_weights
+        option_counts.update(options)
+        if len(option_weights) != len(option_counts):
+            for option in option_counts:
+                option_weights.setdefault(option, 0)
+        
+        total_weight = self.total_weight
+        weighted_sum = self.weighted_sum
+        for option, value, weight in zip(options, option_values, weights):
+            total_weight += weight
+            weighted_sum += value * weight
+            option_weights[option] += weight
+        self.total_weight = total_weight
+        self.weighted_sum = weighted_sum
+    
+    def result(self, total_tokens: float) -> Dict[str, Any]:
+        """Aggregated vote statistics, in the aggregate_votes shape"""
+        total_votes = self.total_votes
+        if not total_votes:
+            return {
+                "total_votes": 0,
+                "total_weight": 0,
+                "weighted_average": 0,
+                "option_breakdown": {},
+                "participation_rate": 0
+            }
+        
+        total_weight = self.total_weight
+        
+        # Calculate weighted average (0-100 scale)
+        weighted_average = (self.weighted_sum / total_weight) if total_weight > 0 else 0
+        
+        # Calculate participation rate
+        participation_rate = (self.total_tokens_voted / total_tokens) if total_tokens > 0 else 0
+        
+        # Create option breakdown with percentages. option_counts and
+        # option_weights share key order, so they are walked side by side
+        has_weight = total_weight > 0
+        option_breakdown = {
+            option: {
+                "count": count,
+                "percentage": (count / total_votes) * 100,
+                "weight": weight,
+                "weight_percentage": (weight / total_weight) * 100 if has_weight else 0
+            }
+            for (option, count), weight in zip(self.option_counts.items(), self.option_weights.values())
+        }
+        
+        return {
+            "total_votes": total_votes,
+            "unique_voters": len(self.voters),
+            "total_weight": total_weight,
+            "weighted_average": weighted_average,
+            "option_breakdown": option_breakdown,
+            "participation_rate": participation_rate,
+            "total_tokens_voted": self.total_tokens_voted
+        }
+
+
+# Fixed recommendations per sentiment level value, looked up once per poll
+_LEVEL_RECOMMENDATIONS = {
+    SentimentLevel.STRONG_SUPPORT.value: (
+        "🎉 Strong approval - proceed with grant proposal",
+    ),
+    SentimentLevel.SUPPORT.value: (
+        "✅ Community supports proposal - monitor for concerns",
+    ),
+    SentimentLevel.NEUTRAL.value: (
+        "🤔 Mixed sentiment - address community concerns before proceeding",
+        "💬 Engage with community to understand objections"
+    ),
+    SentimentLevel.OPPOSITION.value: (
+        "❌ Community opposes proposal - requires significant revision",
+        "📝 Review feedback and consider alternative approach"
+    ),
+    SentimentLevel.STRONG_OPPOSITION.value: (
+        "❌ Community opposes proposal - requires significant revision",
+        "📝 Review feedback and consider alternative approach"
+    )
+}
+
+
+def _rounded_score(score: float):
+    """Score rounded to the whole percent the messages show (non-finite scores pass through)"""
+    return round(score) if math.isfinite(score) else score
+
+
+# Message templates, filled in with the whole-percent score. The helpers
+# below depend only on (level, whole-percent score), so polls that land on
+# the same pair share one formatted string
+_SENTIMENT_DESCRIPTION_TEMPLATES = {
+    SentimentLevel.STRONG_SUPPORT: "Strong community support ({:.0f}% approval)",
+    SentimentLevel.SUPPORT: "Community supports proposal ({:.0f}% approval)",
+    SentimentLevel.NEUTRAL: "Mixed community sentiment ({:.0f}% approval)",
+    SentimentLevel.OPPOSITION: "Community opposes proposal ({:.0f}% approval)",
+    SentimentLevel.STRONG_OPPOSITION: "Strong community opposition ({:.0f}% approval)"
+}
+
+# Keyed by level value; any other level reads as strong opposition
+_ASSESSMENT_TEMPLATES = {
+    SentimentLevel.STRONG_SUPPORT.value: "APPROVED - Strong community support ({:.0f}%)",
+    SentimentLevel.SUPPORT.value: "APPROVED - Community supports proposal ({:.0f}%)",
+    SentimentLevel.NEUTRAL.value: "PENDING - Mixed sentiment, requires discussion ({:.0f}%)",
+    SentimentLevel.OPPOSITION.value: "REJECTED - Community opposes proposal ({:.0f}%)"
+}
+
+
+@lru_cache(maxsize=512)
+def _sentiment_description(level: SentimentLevel, score: float) -> str:
+    """Sentiment description for a level and whole-percent score"""
+    return _SENTIMENT_DESCRIPTION_TEMPLATES.get(level, "Sentiment score: {:.0f}%").format(score)
+
+
+@lru_cache(maxsize=512)
+def _overall_assessment(level: str, score: float) -> str:
+    """Assessment of a poll that met quorum, for a level value and whole-percent score"""
+    return _ASSESSMENT_TEMPLATES.get(level, "REJECTED - Strong opposition ({:.0f}%)").format(score)
+
+
 class CommunitySentimentAnalyzer:
     """
     Analyzes community sentiment through voting and polling
@@ -63,6 +474,10 @@ class CommunitySentimentAnalyzer:
     - Time-decay for older votes
     """
     
+    # Polls whose option-value tables and running vote totals are kept per
+    # analyzer instance (least recently used polls are dropped first)
+    POLL_CACHE_SIZE = 10000
+    
     def __init__(self):
         """Initialize the community sentiment analyzer"""
         self.logger = logging.getLogger(__name__)
@@ -81,14 +496,27 @@ class CommunitySentimentAnalyzer:
             SentimentLevel.STRONG_OPPOSITION: (0, 20)
         }
         
+        # Sorted lower bounds above the lowest band, and the level for each
+        # band, for a binary-search level lookup
+        bands = sorted(self.SENTIMENT_THRESHOLDS.items(), key=lambda band: band[1][0])
+        self._sentiment_boundaries = tuple(min_val for _, (min_val, _) in bands[1:])
+        self._sentiment_levels = tuple(level for level, _ in bands)
+        
         # Vote options
-        self.DEFAULT_VOTE_OPTIONS = [
-            {"id": "strongly_approve", "label": "Strongly Approve", "value": 100},
-            {"id": "approve", "label": "Approve", "value": 75},
-            {"id": "neutral", "label": "Neutral", "value": 50},
-            {"id": "reject", "label": "Reject", "value": 25},
-            {"id": "strongly_reject", "label": "Strongly Reject", "value": 0}
-        ]
+        self.DEFAULT_VOTE_OPTIONS = _DEFAULT_VOTE_OPTIONS
+        
+        # Option id -> value table per poll_id. A poll's options don't change
+        # once it is created, so the table is built once (by create_poll or the
+        # first analysis) and reused each time the poll is re-analyzed
+        self._poll_cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._poll_cache_lock = threading.Lock()
+        
+        # Running vote totals per poll_id as (voting_strategy, total_tokens,
+        # tally), kept up to date by add_vote so a live poll's sentiment can
+        # be recomputed without re-reading every vote it has received. Bounded
+        # like _poll_cache; an evicted poll is rebuilt by its next analysis
+        self._tallies: "OrderedDict[str, Tuple[VotingStrategy, float, _VoteTally]]" = OrderedDict()
+        self._tally_lock = threading.Lock()
         
         self.logger.info("CommunitySentimentAnalyzer initialized")
     
@@ -117,16 +545,17 @@ class CommunitySentimentAnalyzer:
             Poll details including ID, options, and metadata
         """
         try:
-            self.logger.info(f"Creating poll for grant {grant_id}")
+            self.logger.info("Creating poll for grant %s", grant_id)
+            
+            start_time = get_utc_now()
             
             # Generate poll ID
-            poll_id = f"poll_{grant_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            poll_id = f"poll_{grant_id}_{start_time.strftime('%Y%m%d_%H%M%S')}"
             
             # Set vote options
             vote_options = custom_options if custom_options else self.DEFAULT_VOTE_OPTIONS
             
             # Calculate end time
-            start_time = datetime.now()
             end_time = start_time + timedelta(hours=duration_hours)
             
             # Create poll structure
@@ -150,7 +579,9 @@ class CommunitySentimentAnalyzer:
                 }
             }
             
-            self.logger.info(f"Poll created: {poll_id}")
+            self._cache_poll_options(poll_id, _option_value_lut(vote_options))
+            
+            self.logger.info("Poll created: %s", poll_id)
             
             return {
                 "success": True,
@@ -159,7 +590,7 @@ class CommunitySentimentAnalyzer:
             }
             
         except Exception as e:
-            self.logger.error(f"Poll creation failed: {e}", exc_info=True)
+            self.logger.error("Poll creation failed: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": str(e)
@@ -187,133 +618,208 @@ class CommunitySentimentAnalyzer:
         Returns:
             Vote weight (0.0 to 1.0 normalized)
         """
-        try:
-            if voting_strategy == VotingStrategy.ONE_TOKEN_ONE_VOTE:
-                # Linear token-weighted: weight = tokens / total_tokens
-                weight = token_balance / total_tokens if total_tokens > 0 else 0
-                
-            elif voting_strategy == VotingStrategy.QUADRATIC:
-                # Quadratic voting: weight = sqrt(tokens)
-                weight = math.sqrt(token_balance) / math.sqrt(total_tokens) if total_tokens > 0 else 0
-                
-            elif voting_strategy == VotingStrategy.REPUTATION:
-                # Reputation-based: weight = reputation / 100
-                weight = reputation_score / 100.0
-                
-            elif voting_strategy == VotingStrategy.HYBRID:
-                # Hybrid: 60% token-weighted + 40% reputation
-                token_weight = (token_balance / total_tokens) if total_tokens > 0 else 0
-                reputation_weight = reputation_score / 100.0
-                weight = (0.6 * token_weight) + (0.4 * reputation_weight)
-                
-            else:
-                weight = 0
-            
-            # Normalize to 0-1 range
-            return max(0.0, min(1.0, weight))
-            
-        except Exception as e:
-            self.logger.error(f"Vote weight calculation failed: {e}")
-            return 0.0
+        # The weight functions guard their own edge cases (no supply, negative
+        # balances), so a numeric vote cannot raise here
+        return _vote_weights([token_balance], [reputation_score], voting_strategy, total_tokens)[0]
     
     
     def aggregate_votes(
         self,
-        votes: List[Dict[str, Any]],
+        votes: Union[List[Dict[str, Any]], List[VoteRecord]],
         voting_strategy: VotingStrategy,
-        total_tokens: float
+        total_tokens: float,
+        poll_options: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Aggregate votes with weighted scoring
         
         Args:
-            votes: List of vote records
+            votes: List of vote records (dicts or VoteRecords)
             voting_strategy: Weight calculation method
             total_tokens: Total token supply
+            poll_options: The poll's options ("id", "value"), from which each
+                vote's value is looked up (default: the 5-point scale)
             
         Returns:
             Aggregated vote statistics
         """
-        try:
-            if not votes:
-                return {
-                    "total_votes": 0,
-                    "total_weight": 0,
-                    "weighted_average": 0,
-                    "option_breakdown": {},
-                    "participation_rate": 0
-                }
+        voters, options, option_values, token_balances, reputation_scores = _ingest_votes(
+            votes, _option_value_lut(poll_options) if poll_options else _DEFAULT_OPTION_VALUES
+        )
+        return self.aggregate_vote_columns(
+            voters=voters,
+            options=options,
+            option_values=option_values,
+            token_balances=token_balances,
+            reputation_scores=reputation_scores,
+            voting_strategy=voting_strategy,
+            total_tokens=total_tokens
+        )
+    
+    
+    def aggregate_vote_columns(
+        self,
+        voters: Collection[str],
+        options: Sequence[str],
+        option_values: Sequence[float],
+        token_balances: Sequence[float],
+        reputation_scores: Sequence[int],
+        voting_strategy: VotingStrategy,
+        total_tokens: float
+    ) -> Dict[str, Any]:
+        """
+        Aggregate votes stored column-wise (one sequence per vote field)
+        
+        Args:
+            voters: Voter address per vote, or the set of distinct voters
+            options: Chosen option id per vote
+            option_values: Option value (0-100) per vote
+            token_balances: Voter token balance per vote
+            reputation_scores: Voter reputation (0-100) per vote
+            voting_strategy: Weight calculation method
+            total_tokens: Total token supply
             
-            # Initialize counters
-            total_weight = 0
-            weighted_sum = 0
-            option_counts = {}
-            option_weights = {}
-            unique_voters = set()
-            total_tokens_voted = 0
-            
-            # Process each vote
-            for vote in votes:
-                voter = vote.get("voter_address")
-                option = vote.get("option")
-                option_value = safe_float(vote.get("option_value", 50))
-                token_balance = safe_float(vote.get("token_balance", 0))
-                reputation = safe_int(vote.get("reputation_score", 50))
-                
-                # Calculate vote weight
-                weight = self.calculate_vote_weight(
-                    voter,
-                    token_balance,
-                    reputation,
-                    voting_strategy,
-                    total_tokens
-                )
-                
-                # Update counters
-                unique_voters.add(voter)
-                total_weight += weight
-                weighted_sum += option_value * weight
-                total_tokens_voted += token_balance
-                
-                # Track option breakdown
-                if option not in option_counts:
-                    option_counts[option] = 0
-                    option_weights[option] = 0
-                option_counts[option] += 1
-                option_weights[option] += weight
-            
-            # Calculate weighted average (0-100 scale)
-            weighted_average = (weighted_sum / total_weight) if total_weight > 0 else 0
-            
-            # Calculate participation rate
-            participation_rate = (total_tokens_voted / total_tokens) if total_tokens > 0 else 0
-            
-            # Create option breakdown with percentages
-            option_breakdown = {}
-            for option, count in option_counts.items():
-                option_breakdown[option] = {
-                    "count": count,
-                    "percentage": (count / len(votes)) * 100,
-                    "weight": option_weights[option],
-                    "weight_percentage": (option_weights[option] / total_weight) * 100 if total_weight > 0 else 0
-                }
+        Returns:
+            Aggregated vote statistics (same shape as aggregate_votes)
+        """
+        tally = _VoteTally()
+        if option_values:
+            weights = _vote_weights(token_balances, reputation_scores, voting_strategy, total_tokens)
+            tally.add(voters, options, option_values, token_balances, weights)
+        return tally.result(total_tokens)
+    
+    
+    def aggregate_votes_iter(
+        self,
+        votes: Iterable[Union[Dict[str, Any], VoteRecord]],
+        voting_strategy: VotingStrategy,
+        total_tokens: float,
+        chunk_size: int = VOTE_CHUNK_SIZE,
+        poll_options: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregate a stream of votes chunk by chunk
+        
+        Only one chunk of votes is held in memory at a time, so very large
+        polls can be aggregated straight from a cursor or file. The result
+        is identical to aggregate_votes over the same votes.
+        
+        Args:
+            votes: Iterable of vote records (dicts or VoteRecords)
+            voting_strategy: Weight calculation method
+            total_tokens: Total token supply
+            chunk_size: Votes read per chunk
+            poll_options: The poll's options ("id", "value"), from which each
+                vote's value is looked up (default: the 5-point scale)
             
-            return {
-                "total_votes": len(votes),
-                "unique_voters": len(unique_voters),
-                "total_weight": total_weight,
-                "weighted_average": weighted_average,
-                "option_breakdown": option_breakdown,
-                "participation_rate": participation_rate,
-                "total_tokens_voted": total_tokens_voted
-            }
+        Returns:
+            Aggregated vote statistics (same shape as aggregate_votes)
+        """
+        option_value_lut = _option_value_lut(poll_options) if poll_options else _DEFAULT_OPTION_VALUES
+        tally = self._tally_vote_chunks(votes, option_value_lut, voting_strategy, total_tokens, chunk_size)
+        return tally.result(total_tokens)
+    
+    
+    def _tally_vote_chunks(
+        self,
+        votes: Iterable[Union[Dict[str, Any], VoteRecord]],
+        option_value_lut: Dict[str, float],
+        voting_strategy: VotingStrategy,
+        total_tokens: float,
+        chunk_size: int = VOTE_CHUNK_SIZE
+    ) -> _VoteTally:
+        """Fold a stream of votes into a new tally, one chunk of columns at a time"""
+        tally = _VoteTally()
+        votes = iter(votes)
+        while True:
+            chunk = list(islice(votes, chunk_size))
+            if not chunk:
+                break
+            voters, options, option_values, token_balances, reputation_scores = _ingest_votes(
+                chunk, option_value_lut
+            )
+            weights = _vote_weights(token_balances, reputation_scores, voting_strategy, total_tokens)
+            tally.add(voters, options, option_values, token_balances, weights)
+        return tally
+    
+    
+    def add_vote(
+        self,
+        poll_id: str,
+        vote: Union[Dict[str, Any], VoteRecord],
+        voting_strategy: VotingStrategy,
+        total_tokens: float
+    ) -> bool:
+        """
+        Fold one new vote into a poll's running totals
+        
+        Each vote costs one weight calculation and a few additions, however
+        many votes the poll already holds. analyze_poll_results(poll_id,
+        None, ...) then reads the running totals directly.
+        
+        Args:
+            poll_id: Poll identifier
+            vote: Vote record (dict or VoteRecord)
+            voting_strategy: Weight calculation method
+            total_tokens: Total token supply
             
-        except Exception as e:
-            self.logger.error(f"Vote aggregation failed: {e}", exc_info=True)
-            return {
-                "total_votes": 0,
-                "error": str(e)
-            }
+        Returns:
+            True if the vote was counted, False if this voter already voted
+            
+        Raises:
+            ValueError: If the poll's totals were built with a different
+                strategy or token supply
+        """
+        voters, options, option_values, token_balances, reputation_scores = _ingest_votes(
+            [vote], self._poll_option_values(poll_id, None)
+        )
+        weights = _vote_weights(token_balances, reputation_scores, voting_strategy, total_tokens)
+        
+        with self._tally_lock:
+            tally = self._poll_tally(poll_id, voting_strategy, total_tokens)
+            if tally is None:
+                tally = _VoteTally()
+                self._store_tally(poll_id, voting_strategy, total_tokens, tally)
+            elif not voters.isdisjoint(tally.voters):
+                return False
+            tally.add(voters, options, option_values, token_balances, weights)
+        
+        return True
+    
+    
+    def _poll_tally(
+        self,
+        poll_id: str,
+        voting_strategy: VotingStrategy,
+        total_tokens: float
+    ) -> Optional[_VoteTally]:
+        """A poll's running totals, or None if it has none yet (call with _tally_lock held)"""
+        entry = self._tallies.get(poll_id)
+        if entry is None:
+            return None
+        self._tallies.move_to_end(poll_id)
+        
+        tally_strategy, tally_tokens, tally = entry
+        if tally_strategy != voting_strategy or tally_tokens != total_tokens:
+            raise ValueError(
+                f"Poll {poll_id} is tallied with strategy {tally_strategy.value} "
+                f"and total_tokens {tally_tokens}"
+            )
+        return tally
+    
+    
+    def _store_tally(
+        self,
+        poll_id: str,
+        voting_strategy: VotingStrategy,
+        total_tokens: float,
+        tally: _VoteTally
+    ) -> None:
+        """Keep a poll's running totals, evicting the least recently used poll (call with _tally_lock held)"""
+        self._tallies[poll_id] = (voting_strategy, total_tokens, tally)
+        self._tallies.move_to_end(poll_id)
+        if len(self._tallies) > self.POLL_CACHE_SIZE:
+            self._tallies.popitem(last=False)
     
     
     def check_quorum(
@@ -368,7 +874,7 @@ class CommunitySentimentAnalyzer:
             }
             
         except Exception as e:
-            self.logger.error(f"Quorum check failed: {e}")
+            self.logger.error("Quorum check failed: %s", e)
             return {
                 "quorum_met": False,
                 "confidence": 0,
@@ -389,7 +895,8 @@ class CommunitySentimentAnalyzer:
         self,
         weighted_average: float,
         confidence: float,
-        participation_rate: float
+        participation_rate: float,
+        sentiment_level: Optional[SentimentLevel] = None
     ) -> Dict[str, Any]:
         """
         Convert vote results to sentiment score
@@ -398,20 +905,17 @@ class CommunitySentimentAnalyzer:
             weighted_average: Weighted vote average (0-100)
             confidence: Confidence level (0-1)
             participation_rate: Token participation (0-1)
+            sentiment_level: Level of the adjusted score, if already classified
             
         Returns:
             Sentiment score and level
         """
         try:
-            # Base sentiment score is the weighted average
-            sentiment_score = weighted_average
-            
-            # Adjust for low confidence (< 0.5 reduces score reliability)
-            if confidence < 0.5:
-                sentiment_score *= confidence
+            sentiment_score = self._confidence_adjusted_score(weighted_average, confidence)
             
             # Determine sentiment level
-            sentiment_level = self._get_sentiment_level(sentiment_score)
+            if sentiment_level is None:
+                sentiment_level = self._get_sentiment_level(sentiment_score)
             
             # Calculate reliability based on participation and confidence
             reliability = (confidence * 0.6) + (min(participation_rate / 0.2, 1.0) * 0.4)
@@ -425,7 +929,7 @@ class CommunitySentimentAnalyzer:
             }
             
         except Exception as e:
-            self.logger.error(f"Sentiment score calculation failed: {e}")
+            self.logger.error("Sentiment score calculation failed: %s", e)
             return {
                 "sentiment_score": 0,
                 "sentiment_level": SentimentLevel.NEUTRAL.value,
@@ -434,127 +938,431 @@ class CommunitySentimentAnalyzer:
             }
     
     
+    def _confidence_adjusted_score(self, weighted_average: float, confidence: float) -> float:
+        """Base sentiment score is the weighted average, reduced when confidence is low (< 0.5)"""
+        if confidence < 0.5:
+            return weighted_average * confidence
+        return weighted_average
+    
+    
     def _get_sentiment_level(self, score: float) -> SentimentLevel:
-        """Determine sentiment level from score"""
-        for level, (min_val, max_val) in self.SENTIMENT_THRESHOLDS.items():
-            if min_val <= score < max_val:
-                return level
-        return SentimentLevel.NEUTRAL
+        """Determine sentiment level from score (scores past either end fall in the outer bands)"""
+        return self._sentiment_levels[bisect.bisect_right(self._sentiment_boundaries, score)]
+    
+    
+    def _get_sentiment_levels(self, scores: Sequence[float]) -> List[SentimentLevel]:
+        """Determine sentiment levels for many scores in one pass"""
+        levels = self._sentiment_levels
+        boundaries = self._sentiment_boundaries
+        return [levels[bisect.bisect_right(boundaries, score)] for score in scores]
     
     
     def _get_sentiment_description(self, level: SentimentLevel, score: float) -> str:
         """Generate sentiment description"""
-        descriptions = {
-            SentimentLevel.STRONG_SUPPORT: f"Strong community support ({score:.0f}% approval)",
-            SentimentLevel.SUPPORT: f"Community supports proposal ({score:.0f}% approval)",
-            SentimentLevel.NEUTRAL: f"Mixed community sentiment ({score:.0f}% approval)",
-            SentimentLevel.OPPOSITION: f"Community opposes proposal ({score:.0f}% approval)",
-            SentimentLevel.STRONG_OPPOSITION: f"Strong community opposition ({score:.0f}% approval)"
-        }
-        return descriptions.get(level, f"Sentiment score: {score:.0f}%")
+        return _sentiment_description(level, _rounded_score(score))
     
     
     def analyze_poll_results(
         self,
         poll_id: str,
-        votes: List[Dict[str, Any]],
+        votes: Optional[Union[List[Dict[str, Any]], List[VoteRecord]]],
         voting_strategy: VotingStrategy,
         total_tokens: float,
-        grant_amount: Optional[float] = None
+        grant_amount: Optional[float] = None,
+        poll_options: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Complete analysis of poll results
         
         Args:
             poll_id: Poll identifier
-            votes: List of vote records
+            votes: List of vote records (dicts or VoteRecords), which replace
+                the poll's running totals; None analyzes the running totals
+                built up by add_vote
             voting_strategy: Weight calculation method
             total_tokens: Total token supply
             grant_amount: Grant amount (optional, for context)
+            poll_options: The poll's options ("id", "value"), from which each
+                vote's value is looked up (default: the 5-point scale)
             
         Returns:
             Complete sentiment analysis
         """
         try:
-            self.logger.info(f"Analyzing poll results for {poll_id}")
+            self.logger.info("Analyzing poll results for %s", poll_id)
             
             # Aggregate votes
-            aggregation = self.aggregate_votes(votes, voting_strategy, total_tokens)
-            
-            # Check quorum
-            quorum = self.check_quorum(
-                aggregation["total_votes"],
-                aggregation["total_weight"],
-                aggregation["participation_rate"],
-                aggregation.get("unique_voters", 0)
-            )
+            if votes is None:
+                with self._tally_lock:
+                    tally = self._poll_tally(poll_id, voting_strategy, total_tokens)
+                    aggregation = (tally or _VoteTally()).result(total_tokens)
+            else:
+                voters, options, option_values, token_balances, reputation_scores = _ingest_votes(
+                    votes, self._poll_option_values(poll_id, poll_options)
+                )
+                tally = _VoteTally()
+                if option_values:
+                    weights = _vote_weights(token_balances, reputation_scores, voting_strategy, total_tokens)
+                    tally.add(voters, options, option_values, token_balances, weights)
+                aggregation = tally.result(total_tokens)
+                
+                # Later add_vote calls carry on from these votes
+                with self._tally_lock:
+                    self._store_tally(poll_id, voting_strategy, total_tokens, tally)
             
-            # Calculate sentiment
-            sentiment = self.calculate_sentiment_score(
-                aggregation["weighted_average"],
-                quorum["confidence"],
-                aggregation["participation_rate"]
+            return self._build_poll_analysis(poll_id, aggregation, voting_strategy, grant_amount)
+            
+        except Exception as e:
+            self.logger.error("Poll analysis failed for %s: %s", poll_id, e, exc_info=True)
+            return self._poll_analysis_error(poll_id, e)
+    
+    
+    def analyze_poll_results_json(
+        self,
+        poll_id: str,
+        raw_votes: Union[str, bytes],
+        voting_strategy: VotingStrategy,
+        total_tokens: float,
+        grant_amount: Optional[float] = None,
+        poll_options: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Complete analysis of poll results from serialized votes
+        
+        Same result as analyze_poll_results over the decoded votes, for
+        callers that receive votes as JSON (e.g. an HTTP body or a DB
+        export). NDJSON input is decoded and aggregated chunk by chunk, so
+        the full list of vote dicts is never built.
+        
+        Args:
+            poll_id: Poll identifier
+            raw_votes: JSON array of vote objects, or NDJSON (one per line)
+            voting_strategy: Weight calculation method
+            total_tokens: Total token supply
+            grant_amount: Grant amount (optional, for context)
+            poll_options: The poll's options ("id", "value"), from which each
+                vote's value is looked up (default: the 5-point scale)
+            
+        Returns:
+            Complete sentiment analysis
+        """
+        try:
+            self.logger.info("Analyzing poll results for %s", poll_id)
+            
+            tally = self._tally_vote_chunks(
+                _decode_votes(raw_votes),
+                self._poll_option_values(poll_id, poll_options),
+                voting_strategy,
+                total_tokens
             )
+            aggregation = tally.result(total_tokens)
+            
+            # Later add_vote calls carry on from these votes
+            with self._tally_lock:
+                self._store_tally(poll_id, voting_strategy, total_tokens, tally)
+            
+            return self._build_poll_analysis(poll_id, aggregation, voting_strategy, grant_amount)
+            
+        except Exception as e:
+            self.logger.error("Poll analysis failed for %s: %s", poll_id, e, exc_info=True)
+            return self._poll_analysis_error(poll_id, e)
+    
+    
+    def analyze_poll_results_arrays(
+        self,
+        poll_id: str,
+        voters: Sequence[str],
+        options: Sequence[str],
+        option_values: Sequence[float],
+        token_balances: Sequence[float],
+        reputation_scores: Sequence[int],
+        voting_strategy: VotingStrategy,
+        total_tokens: float,
+        grant_amount: Optional[float] = None,
+        poll_options: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Complete analysis of poll results supplied column-wise
+        
+        Same result as analyze_poll_results, but skips building and
+        re-reading one dict per vote when the caller already holds votes
+        as parallel sequences (e.g. straight from a DB result).
+        
+        Args:
+            poll_id: Poll identifier
+            voters: Voter address per vote
+            options: Chosen option id per vote
+            option_values: Option value (0-100) per vote, used only for
+                options missing from the poll's option table
+            token_balances: Voter token balance per vote
+            reputation_scores: Voter reputation (0-100) per vote
+            voting_strategy: Weight calculation method
+            total_tokens: Total token supply
+            grant_amount: Grant amount (optional, for context)
+            poll_options: The poll's options ("id", "value"), from which each
+                vote's value is looked up (default: the 5-point scale)
             
-            # Generate recommendations
-            recommendations = self._generate_recommendations(
-                sentiment,
-                quorum,
-                aggregation,
-                grant_amount
+        Returns:
+            Complete sentiment analysis
+        """
+        try:
+            self.logger.info("Analyzing poll results for %s", poll_id)
+            
+            # Value votes from the same table as analyze_poll_results
+            option_value_lut = self._poll_option_values(poll_id, poll_options)
+            try:
+                option_values = [option_value_lut[option] for option in options]
+            except KeyError:
+                option_values = [
+                    option_value_lut[option] if option in option_value_lut else value
+                    for option, value in zip(options, option_values)
+                ]
+            
+            aggregation = self.aggregate_vote_columns(
+                voters,
+                options,
+                option_values,
+                token_balances,
+                reputation_scores,
+                voting_strategy,
+                total_tokens
             )
             
-            # Build complete analysis
-            analysis = {
-                "poll_id": poll_id,
-                "analysis_timestamp": datetime.now().isoformat(),
-                "voting_strategy": voting_strategy.value,
-                
-                # Vote statistics
-                "vote_statistics": {
-                    "total_votes": aggregation["total_votes"],
-                    "unique_voters": aggregation.get("unique_voters", 0),
-                    "total_weight": round(aggregation["total_weight"], 4),
-                    "participation_rate": round(aggregation["participation_rate"] * 100, 2),
-                    "tokens_voted": aggregation.get("total_tokens_voted", 0)
-                },
-                
-                # Option breakdown
-                "option_breakdown": aggregation["option_breakdown"],
-                
-                # Quorum status
-                "quorum": {
-                    "met": quorum["quorum_met"],
-                    "confidence": round(quorum["confidence"], 3),
-                    "details": quorum.get("details", ""),
-                    "checks": quorum.get("checks", {})
-                },
-                
-                # Sentiment analysis
-                "sentiment": sentiment,
+            return self._build_poll_analysis(poll_id, aggregation, voting_strategy, grant_amount)
+            
+        except Exception as e:
+            self.logger.error("Poll analysis failed for %s: %s", poll_id, e, exc_info=True)
+            return self._poll_analysis_error(poll_id, e)
+    
+    
+    def analyze_poll_results_batch(
+        self,
+        polls: List[Dict[str, Any]],
+        total_tokens: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Complete analysis of many polls in one call
+        
+        Each poll gets the same result analyze_poll_results would return; a
+        poll that fails to analyze gets an error entry without affecting the
+        rest of the batch.
+        
+        Args:
+            polls: Poll records as returned by create_poll ("poll_id",
+                "voting_strategy", "options", "votes"), optionally with
+                "grant_amount". Vote values come from the poll's options
+            total_tokens: Total token supply
+            
+        Returns:
+            One sentiment analysis per poll, in input order
+        """
+        self.logger.info("Analyzing poll results for %d polls", len(polls))
+        
+        # One timestamp for the whole batch
+        analysis_timestamp = get_utc_now().isoformat()
+        
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(polls)
+        
+        # Aggregate and quorum-check every poll first...
+        pending = []
+        for index, poll in enumerate(polls):
+            poll_id = poll.get("poll_id")
+            try:
+                voting_strategy = VotingStrategy(poll.get("voting_strategy", VotingStrategy.HYBRID))
+                voters, options, option_values, token_balances, reputation_scores = _ingest_votes(
+                    poll.get("votes", []),
+                    self._poll_option_values(poll_id, poll.get("options"))
+                )
+                aggregation = self.aggregate_vote_columns(
+                    voters,
+                    options,
+                    option_values,
+                    token_balances,
+                    reputation_scores,
+                    voting_strategy,
+                    total_tokens
+                )
+                pending.append((index, voting_strategy, aggregation, self._check_aggregation_quorum(aggregation)))
                 
-                # Recommendations
-                "recommendations": recommendations,
+            except Exception as e:
+                self.logger.error("Poll analysis failed for %s: %s", poll_id, e, exc_info=True)
+                analyses[index] = self._poll_analysis_error(poll_id, e, analysis_timestamp)
+        
+        # ...so all of their sentiment scores can be classified in one pass
+        sentiment_levels = self._get_sentiment_levels([
+            self._confidence_adjusted_score(aggregation["weighted_average"], quorum["confidence"])
+            for _, _, aggregation, quorum in pending
+        ])
+        
+        for (index, voting_strategy, aggregation, quorum), sentiment_level in zip(pending, sentiment_levels):
+            poll = polls[index]
+            poll_id = poll.get("poll_id")
+            try:
+                analyses[index] = self._build_poll_analysis(
+                    poll_id,
+                    aggregation,
+                    voting_strategy,
+                    poll.get("grant_amount"),
+                    quorum=quorum,
+                    sentiment_level=sentiment_level,
+                    analysis_timestamp=analysis_timestamp
+                )
                 
-                # Overall assessment
-                "overall_assessment": self._get_overall_assessment(sentiment, quorum)
-            }
+            except Exception as e:
+                self.logger.error("Poll analysis failed for %s: %s", poll_id, e, exc_info=True)
+                analyses[index] = self._poll_analysis_error(poll_id, e, analysis_timestamp)
+        
+        return analyses
+    
+    
+    def _poll_option_values(
+        self,
+        poll_id: str,
+        poll_options: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, float]:
+        """
+        Option id -> value table for a poll
+        
+        Options passed by the caller win and replace the cached table, so
+        every entry point values the same votes the same way; otherwise the
+        table cached by create_poll or an earlier analysis is used.
+        
+        Args:
+            poll_id: Poll identifier
+            poll_options: The poll's options, if the caller has them
             
-            self.logger.info(
-                f"Poll analysis complete: {poll_id}, "
-                f"sentiment={sentiment['sentiment_level']}, "
-                f"score={sentiment['sentiment_score']}"
-            )
+        Returns:
+            The table (the default scale's when the poll is unknown and no
+            options were given)
+        """
+        if poll_options:
+            option_value_lut = _option_value_lut(poll_options)
+            self._cache_poll_options(poll_id, option_value_lut)
+            return option_value_lut
+        
+        with self._poll_cache_lock:
+            option_value_lut = self._poll_cache.get(poll_id)
+            if option_value_lut is not None:
+                self._poll_cache.move_to_end(poll_id)
+                return option_value_lut
+        
+        return _DEFAULT_OPTION_VALUES
+    
+    
+    def _cache_poll_options(self, poll_id: str, option_value_lut: Dict[str, float]) -> None:
+        """Remember a poll's option-value table, evicting the least recently used poll"""
+        with self._poll_cache_lock:
+            self._poll_cache[poll_id] = option_value_lut
+            self._poll_cache.move_to_end(poll_id)
+            if len(self._poll_cache) > self.POLL_CACHE_SIZE:
+                self._poll_cache.popitem(last=False)
+    
+    
+    def _poll_analysis_error(
+        self,
+        poll_id: str,
+        error: Exception,
+        analysis_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Result returned for a poll whose analysis failed"""
+        return {
+            "poll_id": poll_id,
+            "error": str(error),
+            "analysis_timestamp": analysis_timestamp or get_utc_now().isoformat()
+        }
+    
+    
+    def _check_aggregation_quorum(self, aggregation: Dict[str, Any]) -> Dict[str, Any]:
+        """Run check_quorum on aggregate_votes output"""
+        return self.check_quorum(
+            aggregation["total_votes"],
+            aggregation["total_weight"],
+            aggregation["participation_rate"],
+            aggregation.get("unique_voters", 0)
+        )
+    
+    
+    def _build_poll_analysis(
+        self,
+        poll_id: str,
+        aggregation: Dict[str, Any],
+        voting_strategy: VotingStrategy,
+        grant_amount: Optional[float],
+        quorum: Optional[Dict[str, Any]] = None,
+        sentiment_level: Optional[SentimentLevel] = None,
+        analysis_timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Turn aggregated vote statistics into the full poll analysis
+        
+        quorum, sentiment_level and analysis_timestamp may be passed in when
+        the caller already has them (as analyze_poll_results_batch does).
+        """
+        # Check quorum
+        if quorum is None:
+            quorum = self._check_aggregation_quorum(aggregation)
+        
+        # Calculate sentiment
+        sentiment = self.calculate_sentiment_score(
+            aggregation["weighted_average"],
+            quorum["confidence"],
+            aggregation["participation_rate"],
+            sentiment_level
+        )
+        
+        # Generate recommendations
+        recommendations = self._generate_recommendations(
+            sentiment,
+            quorum,
+            aggregation,
+            grant_amount
+        )
+        
+        # Build complete analysis
+        analysis = {
+            "poll_id": poll_id,
+            "analysis_timestamp": analysis_timestamp or get_utc_now().isoformat(),
+            "voting_strategy": voting_strategy.value,
             
-            return analysis
+            # Vote statistics
+            "vote_statistics": {
+                "total_votes": aggregation["total_votes"],
+                "unique_voters": aggregation.get("unique_voters", 0),
+                "total_weight": round(aggregation["total_weight"], 4),
+                "participation_rate": round(aggregation["participation_rate"] * 100, 2),
+                "tokens_voted": aggregation.get("total_tokens_voted", 0)
+            },
             
-        except Exception as e:
-            self.logger.error(f"Poll analysis failed for {poll_id}: {e}", exc_info=True)
-            return {
-                "poll_id": poll_id,
-                "error": str(e),
-                "analysis_timestamp": datetime.now().isoformat()
-            }
+            # Option breakdown
+            "option_breakdown": aggregation["option_breakdown"],
+            
+            # Quorum status
+            "quorum": {
+                "met": quorum["quorum_met"],
+                "confidence": round(quorum["confidence"], 3),
+                "details": quorum.get("details", ""),
+                "checks": quorum.get("checks", {})
+            },
+            
+            # Sentiment analysis
+            "sentiment": sentiment,
+            
+            # Recommendations
+            "recommendations": recommendations,
+            
+            # Overall assessment
+            "overall_assessment": self._get_overall_assessment(sentiment, quorum)
+        }
+        
+        # Per-poll detail; the entry points log at INFO
+        self.logger.debug(
+            "Poll analysis complete: %s, sentiment=%s, score=%s",
+            poll_id,
+            sentiment['sentiment_level'],
+            sentiment['sentiment_score']
+        )
+        
+        return analysis
     
     
     def _generate_recommendations(
@@ -583,21 +1391,9 @@ class CommunitySentimentAnalyzer:
             recommendations.append("✅ Strong participation (> 30%) - results highly representative")
         
         # Sentiment recommendations
-        if level == SentimentLevel.STRONG_SUPPORT.value:
-            recommendations.append("🎉 Strong approval - proceed with grant proposal")
-            if grant_amount and grant_amount > 100000:
-                recommendations.append("💰 Large grant amount - ensure milestone tracking")
-        
-        elif level == SentimentLevel.SUPPORT.value:
-            recommendations.append("✅ Community supports proposal - monitor for concerns")
-        
-        elif level == SentimentLevel.NEUTRAL.value:
-            recommendations.append("🤔 Mixed sentiment - address community concerns before proceeding")
-            recommendations.append("💬 Engage with community to understand objections")
-        
-        elif level in [SentimentLevel.OPPOSITION.value, SentimentLevel.STRONG_OPPOSITION.value]:
-            recommendations.append("❌ Community opposes proposal - requires significant revision")
-            recommendations.append("📝 Review feedback and consider alternative approach")
+        recommendations.extend(_LEVEL_RECOMMENDATIONS.get(level, ()))
+        if level == SentimentLevel.STRONG_SUPPORT.value and grant_amount and grant_amount > 100000:
+            recommendations.append("💰 Large grant amount - ensure milestone tracking")
         
         # Confidence recommendations
         if sentiment.get("confidence", 0) < 0.5:
@@ -619,22 +1415,72 @@ class CommunitySentimentAnalyzer:
         if not quorum_met:
             return "INVALID - Quorum not met, results not representative"
         
-        if level == SentimentLevel.STRONG_SUPPORT.value:
-            return f"APPROVED - Strong community support ({score:.0f}%)"
-        elif level == SentimentLevel.SUPPORT.value:
-            return f"APPROVED - Community supports proposal ({score:.0f}%)"
-        elif level == SentimentLevel.NEUTRAL.value:
-            return f"PENDING - Mixed sentiment, requires discussion ({score:.0f}%)"
-        elif level == SentimentLevel.OPPOSITION.value:
-            return f"REJECTED - Community opposes proposal ({score:.0f}%)"
-        else:
-            return f"REJECTED - Strong opposition ({score:.0f}%)"
+        return _overall_assessment(level, _rounded_score(score))
 
 
 # ============================================================================
 # TESTING
 # ============================================================================
 
+def format_analysis(analysis: Dict[str, Any], total_tokens: Optional[float] = None) -> str:
+    """
+    Render a poll analysis as a plain-text report
+    
+    The report is built as a list of lines and joined once, so it can be
+    written or logged in a single call.
+    
+    Args:
+        analysis: Result of analyze_poll_results (or one of its variants)
+        total_tokens: Total token supply, to show tokens voted as a share of it
+        
+    Returns:
+        Multi-line report
+    """
+    if "error" in analysis:
+        return f"\n❌ ANALYSIS FAILED: {analysis['error']}"
+    
+    stats = analysis["vote_statistics"]
+    quorum = analysis["quorum"]
+    sentiment = analysis["sentiment"]
+    recommendations = analysis["recommendations"]
+    
+    tokens_voted = f"   Tokens Voted: {stats['tokens_voted']:,.0f}"
+    if total_tokens:
+        tokens_voted += f" ({stats['tokens_voted'] / total_tokens * 100:.1f}% of supply)"
+    
+    lines = [
+        "\n📊 VOTE STATISTICS:",
+        "   Total Votes: {total_votes}".format_map(stats),
+        "   Unique Voters: {unique_voters}".format_map(stats),
+        "   Participation: {participation_rate:.2f}%".format_map(stats),
+        tokens_voted,
+        "\n🎯 OPTION BREAKDOWN:"
+    ]
+    lines.extend(
+        f"   {option}: {data['count']} votes ({data['percentage']:.1f}%), weight: {data['weight_percentage']:.1f}%"
+        for option, data in analysis["option_breakdown"].items()
+    )
+    lines += [
+        "\n✅ QUORUM:",
+        f"   Met: {quorum['met']}",
+        f"   Confidence: {quorum['confidence']:.1%}",
+        f"   Details: {quorum['details']}",
+        "\n💭 SENTIMENT:",
+        "   Score: {sentiment_score}/100".format_map(sentiment),
+        "   Level: {sentiment_level}".format_map(sentiment),
+        "   Confidence: {confidence:.1%}".format_map(sentiment),
+        "   Reliability: {reliability:.1%}".format_map(sentiment),
+        "   Description: {description}".format_map(sentiment),
+        f"\n💡 RECOMMENDATIONS ({len(recommendations)}):"
+    ]
+    lines.extend(f"   • {rec}" for rec in recommendations)
+    lines += [
+        "\n🎯 OVERALL ASSESSMENT:",
+        f"   {analysis['overall_assessment']}"
+    ]
+    return "\n".join(lines)
+
+
 if __name__ == "__main__":
     """Test the community sentiment analyzer"""
     print("\n" + "=" * 80)
@@ -661,24 +1507,24 @@ if __name__ == "__main__":
     print("\n2. Simulating votes...")
     votes = [
         # Strong supporters with high tokens
-        {"voter_address": "0x1", "option": "strongly_approve", "option_value": 100, "token_balance": 10000, "reputation_score": 90},
-        {"voter_address": "0x2", "option": "strongly_approve", "option_value": 100, "token_balance": 8000, "reputation_score": 85},
-        {"voter_address": "0x3", "option": "approve", "option_value": 75, "token_balance": 5000, "reputation_score": 75},
-        {"voter_address": "0x4", "option": "approve", "option_value": 75, "token_balance": 4000, "reputation_score": 70},
+        {"voter_address": "0x1", "option": "strongly_approve", "token_balance": 10000, "reputation_score": 90},
+        {"voter_address": "0x2", "option": "strongly_approve", "token_balance": 8000, "reputation_score": 85},
+        {"voter_address": "0x3", "option": "approve", "token_balance": 5000, "reputation_score": 75},
+        {"voter_address": "0x4", "option": "approve", "token_balance": 4000, "reputation_score": 70},
         
         # Moderate supporters
-        {"voter_address": "0x5", "option": "approve", "option_value": 75, "token_balance": 3000, "reputation_score": 65},
-        {"voter_address": "0x6", "option": "neutral", "option_value": 50, "token_balance": 2000, "reputation_score": 60},
-        {"voter_address": "0x7", "option": "approve", "option_value": 75, "token_balance": 1500, "reputation_score": 55},
+        {"voter_address": "0x5", "option": "approve", "token_balance": 3000, "reputation_score": 65},
+        {"voter_address": "0x6", "option": "neutral", "token_balance": 2000, "reputation_score": 60},
+        {"voter_address": "0x7", "option": "approve", "token_balance": 1500, "reputation_score": 55},
         
         # Some opposition
-        {"voter_address": "0x8", "option": "reject", "option_value": 25, "token_balance": 1000, "reputation_score": 50},
-        {"voter_address": "0x9", "option": "neutral", "option_value": 50, "token_balance": 800, "reputation_score": 45},
-        {"voter_address": "0x10", "option": "reject", "option_value": 25, "token_balance": 500, "reputation_score": 40},
+        {"voter_address": "0x8", "option": "reject", "token_balance": 1000, "reputation_score": 50},
+        {"voter_address": "0x9", "option": "neutral", "token_balance": 800, "reputation_score": 45},
+        {"voter_address": "0x10", "option": "reject", "token_balance": 500, "reputation_score": 40},
         
         # Additional small voters
-        {"voter_address": "0x11", "option": "approve", "option_value": 75, "token_balance": 300, "reputation_score": 35},
-        {"voter_address": "0x12", "option": "approve", "option_value": 75, "token_balance": 200, "reputation_score": 30},
+        {"voter_address": "0x11", "option": "approve", "token_balance": 300, "reputation_score": 35},
+        {"voter_address": "0x12", "option": "approve", "token_balance": 200, "reputation_score": 30},
     ]
     
     total_supply = 100000  # Total token supply
@@ -697,37 +1543,7 @@ if __name__ == "__main__":
     )
     
     # Print results
-    print(f"\n📊 VOTE STATISTICS:")
-    stats = analysis['vote_statistics']
-    print(f"   Total Votes: {stats['total_votes']}")
-    print(f"   Unique Voters: {stats['unique_voters']}")
-    print(f"   Participation: {stats['participation_rate']:.2f}%")
-    print(f"   Tokens Voted: {stats['tokens_voted']:,.0f} ({stats['tokens_voted']/total_supply*100:.1f}% of supply)")
-    
-    print(f"\n🎯 OPTION BREAKDOWN:")
-    for option, data in analysis['option_breakdown'].items():
-        print(f"   {option}: {data['count']} votes ({data['percentage']:.1f}%), weight: {data['weight_percentage']:.1f}%")
-    
-    print(f"\n✅ QUORUM:")
-    quorum = analysis['quorum']
-    print(f"   Met: {quorum['met']}")
-    print(f"   Confidence: {quorum['confidence']:.1%}")
-    print(f"   Details: {quorum['details']}")
-    
-    print(f"\n💭 SENTIMENT:")
-    sentiment = analysis['sentiment']
-    print(f"   Score: {sentiment['sentiment_score']}/100")
-    print(f"   Level: {sentiment['sentiment_level']}")
-    print(f"   Confidence: {sentiment['confidence']:.1%}")
-    print(f"   Reliability: {sentiment['reliability']:.1%}")
-    print(f"   Description: {sentiment['description']}")
-    
-    print(f"\n💡 RECOMMENDATIONS ({len(analysis['recommendations'])}):")
-    for rec in analysis['recommendations']:
-        print(f"   • {rec}")
-    
-    print(f"\n🎯 OVERALL ASSESSMENT:")
-    print(f"   {analysis['overall_assessment']}")
+    print(format_analysis(analysis, total_supply))
     
     print("\n" + "=" * 80)
     print("✅ All tests completed successfully!")
@@ -3,17 +3,24 @@ Due Diligence Analyzer Service for AgentDAO
 Performs background checks on grant applicants including GitHub, wallet, and reputation analysis
 """
 
+import atexit
+import contextvars
+import functools
 import json
 import time
+import random
 import re
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import logging
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from config import settings
 from utils.common import get_utc_now
@@ -23,6 +30,144 @@ from utils.common import get_utc_now
 logger = logging.getLogger(__name__)
 
 
+def _parse_github_timestamp(value: str) -> datetime:
+    """
+    Parse a GitHub API timestamp ('2024-01-31T12:00:00Z') as naive UTC
+    
+    GitHub timestamps all share this fixed-width layout, so they also sort
+    chronologically as plain strings; callers compare the strings and parse
+    only the ones they need.
+    """
+    return datetime.fromisoformat(value.removesuffix('Z'))
+
+
+# Bare GitHub username, and Ethereum address (0x + 40 hex characters); used
+# with fullmatch so a trailing newline is not accepted
+_GITHUB_USERNAME_RE = re.compile(r'[a-zA-Z0-9\-]+')
+_ETH_ADDRESS_RE = re.compile(r'0x[a-fA-F0-9]{40}')
+
+# HTTP session shared by every analyzer, so pooled keep-alive connections
+# (and their TLS sessions) outlive individual analyzer instances
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get or create the shared HTTP session (closed at interpreter exit)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # Retries are handled by DueDiligenceAnalyzer._request. The pools
+            # keep enough connections alive per host for the concurrent
+            # fan-out, so parallel requests reuse sockets instead of
+            # repeating TLS handshakes
+            _session = requests.Session()
+            _session.headers['Connection'] = 'keep-alive'
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, pool_block=False)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            atexit.register(_session.close)
+        return _session
+
+
+# Per-host throttling and the response cache are process-wide like the
+# session, so every analyzer honours the rate-limit state the others learned,
+# the per-host concurrency caps hold across analyzers, and cached responses
+# are shared
+
+# Caps parallel requests per host when analyses run concurrently
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+# Earliest monotonic time the next request to each host may start
+_host_next_request: Dict[str, float] = {}
+_throttle_lock = threading.Lock()
+
+# (url, params) -> (ETag, parsed body, fresh-until monotonic time).
+# Fresh entries are reused outright; stale GitHub entries are revalidated,
+# and an unchanged resource comes back as 304 Not Modified, which costs no
+# primary rate limit and carries no body
+_response_cache: "OrderedDict[Tuple[str, Tuple], Tuple[Optional[str], Any, float]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+class RateLimitWaitExceeded(Exception):
+    """An analysis would wait on API rate limits longer than its budget allows"""
+
+
+class _ThrottleBudget:
+    """Seconds an analysis may still spend waiting on rate limits, shared by its threads"""
+    
+    def __init__(self, seconds: float):
+        self._remaining = seconds
+        self._lock = threading.Lock()
+    
+    def spend(self, seconds: float) -> bool:
+        """Take seconds from the budget, or return False (taking nothing) if it can't cover them"""
+        with self._lock:
+            if seconds > self._remaining:
+                return False
+            self._remaining -= seconds
+            return True
+
+
+# The running analysis's budget; worker threads see it through _submit
+_throttle_budget: contextvars.ContextVar[Optional[_ThrottleBudget]] = contextvars.ContextVar(
+    '_throttle_budget', default=None
+)
+
+
+def _submit(executor: ThreadPoolExecutor, fn, *args) -> Future:
+    """Submit fn with the caller's context, so the analysis's throttle budget follows it"""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _with_throttle_budget(method):
+    """Give each top-level analysis its own throttle budget; nested calls share the caller's"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _throttle_budget.get() is not None:
+            return method(self, *args, **kwargs)
+        token = _throttle_budget.set(_ThrottleBudget(self.MAX_THROTTLE_WAIT_PER_ANALYSIS))
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _throttle_budget.reset(token)
+    return wrapper
+
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+ETHERSCAN_API_URL = "https://api.etherscan.io/api"
+
+# User profile plus repositories in a single GraphQL request (1 rate-limit
+# point instead of 2 REST calls), selecting only the fields the analysis uses.
+# Repositories match REST's /users/{user}/repos?type=all (owned plus
+# collaborator), not every repository reachable through org membership
+GITHUB_PROFILE_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    createdAt
+    followers { totalCount }
+    following { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    repositories(
+      first: 100
+      privacy: PUBLIC
+      ownerAffiliations: [OWNER, COLLABORATOR]
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      nodes {
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        updatedAt
+      }
+    }
+  }
+}
+"""
+
+
 class DueDiligenceAnalyzer:
     """
     Due diligence and background verification analyzer
@@ -38,21 +183,73 @@ class DueDiligenceAnalyzer:
     Risk Scoring: 0 (high risk) to 100 (low risk/trustworthy)
     """
     
+    # Profiles and wallets analyzed at once by perform_due_diligence
+    MAX_WORKERS = 8
+    
+    # GitHub accounts younger than this are scored without fetching their
+    # repositories or activity (they are flagged as new either way)
+    NEW_ACCOUNT_DAYS = 7
+    
+    # Event types that count towards commit frequency
+    COMMIT_EVENT_TYPES = ('PushEvent', 'PullRequestEvent')
+    
+    # Requests allowed in flight at once per API host
+    HOST_CONCURRENCY = {
+        'api.github.com': 4,
+        'api.etherscan.io': 3
+    }
+    DEFAULT_HOST_CONCURRENCY = 2
+    
+    # Minimum seconds between request starts per host (Etherscan allows 5/s
+    # and sends no rate-limit headers)
+    HOST_MIN_INTERVAL = {
+        'api.etherscan.io': 0.2
+    }
+    
+    # Below this share of X-RateLimit-Limit left in the window (at most
+    # RATE_LIMIT_THRESHOLD requests), requests to the host are spread evenly
+    # over the time until the limit resets. Scaling with the limit keeps
+    # unauthenticated GitHub (60/h) from being throttled after a few calls
+    RATE_LIMIT_THRESHOLD = 50
+    RATE_LIMIT_THRESHOLD_RATIO = 0.1
+    
+    # Longest single wait imposed by rate-limit headers
+    MAX_THROTTLE_SECONDS = 60
+    
+    # Longest total rate-limit wait per analysis; past it, requests fail
+    # fast with RateLimitWaitExceeded and the analysis degrades
+    MAX_THROTTLE_WAIT_PER_ANALYSIS = 30
+    
+    # Retries for transient failures, waiting min(cap, base * 2**attempt)
+    # plus up to RETRY_JITTER seconds so parallel workers don't retry in step
+    MAX_RETRIES = 3
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_BACKOFF_BASE = 0.5
+    RETRY_BACKOFF_CAP = 30
+    RETRY_JITTER = 1.0
+    
+    # API responses kept for reuse and conditional (If-None-Match) revalidation
+    RESPONSE_CACHE_SIZE = 2048
+    
+    # Seconds each kind of response is reused without asking the API again
+    CACHE_TTLS = {
+        'github_user': 6 * 3600,
+        'github_profile': 3600,
+        'github_repos': 3600,
+        'github_events': 15 * 60,
+        'etherscan_balance': 5 * 60,
+        'etherscan_transactions': 5 * 60,
+        'etherscan_code': 24 * 3600  # Deployed contract code never changes
+    }
+    
     def __init__(self):
         """Initialize Due Diligence Analyzer with API clients"""
         self.github_token = settings.GITHUB_API_KEY if hasattr(settings, 'GITHUB_API_KEY') else None
         self.etherscan_key = settings.ETHERSCAN_API_KEY if hasattr(settings, 'ETHERSCAN_API_KEY') else None
         
-        # Setup HTTP session with retries
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Shared HTTP session (connection pools, throttling and the response
+        # cache are process-wide)
+        self.session = get_http_session()
         
         # GitHub API headers
         self.github_headers = {
@@ -68,6 +265,204 @@ class DueDiligenceAnalyzer:
         if not self.etherscan_key:
             logger.warning("Etherscan API key not configured - blockchain analysis limited")
     
+    def _host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to a host"""
+        with _host_semaphores_lock:
+            semaphore = _host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    self.HOST_CONCURRENCY.get(host, self.DEFAULT_HOST_CONCURRENCY)
+                )
+                _host_semaphores[host] = semaphore
+            return semaphore
+    
+    def _wait_for_host(self, host: str) -> None:
+        """
+        Sleep until this request's turn for the host, and book the next turn
+        
+        Raises:
+            RateLimitWaitExceeded: The wait would overrun the analysis's throttle budget
+        """
+        with _throttle_lock:
+            now = time.monotonic()
+            start = max(now, _host_next_request.get(host, 0.0))
+            budget = _throttle_budget.get()
+            if start > now and budget is not None and not budget.spend(start - now):
+                raise RateLimitWaitExceeded(
+                    f"Rate limit for {host} needs a {start - now:.0f}s wait, over the analysis budget"
+                )
+            _host_next_request[host] = start + self.HOST_MIN_INTERVAL.get(host, 0.0)
+        
+        if start > now:
+            time.sleep(start - now)
+    
+    def _update_throttle(self, host: str, response: requests.Response) -> None:
+        """
+        Slow requests to a host down according to its rate-limit headers
+        
+        A 429 waits out Retry-After (seconds or an HTTP date). Otherwise,
+        once X-RateLimit-Remaining drops below RATE_LIMIT_THRESHOLD, the
+        remaining requests are spread evenly until X-RateLimit-Reset
+        (RATE_LIMIT_THRESHOLD_RATIO of X-RateLimit-Limit, when sent, caps it).
+        """
+        headers = response.headers
+        delay = 0.0
+        try:
+            if response.status_code == 429 and headers.get('Retry-After'):
+                retry_after = headers['Retry-After']
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            elif headers.get('X-RateLimit-Remaining') is not None:
+                remaining = int(headers['X-RateLimit-Remaining'])
+                threshold = self.RATE_LIMIT_THRESHOLD
+                if headers.get('X-RateLimit-Limit') is not None:
+                    threshold = min(threshold, int(headers['X-RateLimit-Limit']) * self.RATE_LIMIT_THRESHOLD_RATIO)
+                if remaining < threshold:
+                    until_reset = float(headers.get('X-RateLimit-Reset', 0)) - time.time()
+                    delay = max(until_reset, 0.0) / max(remaining, 1)
+        except (TypeError, ValueError):
+            return
+        
+        if delay > 0:
+            resume_at = time.monotonic() + min(delay, self.MAX_THROTTLE_SECONDS)
+            with _throttle_lock:
+                if resume_at > _host_next_request.get(host, 0.0):
+                    _host_next_request[host] = resume_at
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt + 1 (exponential, capped, jittered)"""
+        backoff = min(self.RETRY_BACKOFF_CAP, self.RETRY_BACKOFF_BASE * 2 ** attempt)
+        return backoff + random.uniform(0, self.RETRY_JITTER)
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session, throttled per host
+        
+        Connection errors, timeouts and RETRY_STATUSES responses are retried
+        up to MAX_RETRIES times with jittered exponential backoff.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to session.request (headers, params, json, timeout)
+        
+        Returns:
+            HTTP response
+        """
+        host = urlparse(url).netloc
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                with self._host_semaphore(host):
+                    self._wait_for_host(host)
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                logger.warning(f"Request to {host} failed ({e}), retrying")
+            else:
+                self._update_throttle(host, response)
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                    return response
+                logger.warning(f"Request to {host} returned {response.status_code}, retrying")
+            
+            time.sleep(self._backoff_delay(attempt))
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL through the shared session, throttled per host"""
+        return self._request('GET', url, **kwargs)
+    
+    def _cached_response(self, cache_key: Tuple[str, Tuple]) -> Optional[Tuple[Optional[str], Any, float]]:
+        """Get a cached (ETag, body, fresh-until) entry, marking it recently used"""
+        with _response_cache_lock:
+            entry = _response_cache.get(cache_key)
+            if entry is not None:
+                _response_cache.move_to_end(cache_key)
+            return entry
+    
+    def _cache_response(
+        self,
+        cache_key: Tuple[str, Tuple],
+        etag: Optional[str],
+        data: Any,
+        cache_kind: str
+    ) -> None:
+        """Cache a response body for its kind's TTL, evicting the least recently used"""
+        fresh_until = time.monotonic() + self.CACHE_TTLS[cache_kind]
+        with _response_cache_lock:
+            _response_cache[cache_key] = (etag, data, fresh_until)
+            _response_cache.move_to_end(cache_key)
+            if len(_response_cache) > self.RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+    
+    def _github_get(
+        self,
+        url: str,
+        cache_kind: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Any]:
+        """
+        GET a GitHub REST endpoint through the response cache
+        
+        Args:
+            url: GitHub API URL
+            cache_kind: CACHE_TTLS entry giving how long the response stays fresh
+            params: Query parameters
+        
+        Returns:
+            Tuple of (status_code, parsed body or None). A fresh cached body,
+            or one confirmed by 304 Not Modified, is returned as 200
+        """
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        entry = self._cached_response(cache_key)
+        
+        headers = self.github_headers
+        if entry is not None:
+            etag, data, fresh_until = entry
+            if time.monotonic() < fresh_until:
+                return 200, data
+            if etag:
+                headers = {**headers, 'If-None-Match': etag}
+        
+        response = self._get(url, headers=headers, params=params, timeout=10)
+        
+        if response.status_code == 304 and entry is not None:
+            self._cache_response(cache_key, etag, data, cache_kind)
+            return 200, data
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = response.json()
+        self._cache_response(cache_key, response.headers.get('ETag'), data, cache_kind)
+        return 200, data
+    
+    def _etherscan_get(self, params: Dict[str, Any], cache_kind: str) -> Optional[Dict[str, Any]]:
+        """
+        GET the Etherscan API through the response cache
+        
+        Args:
+            params: Query parameters, without the API key
+            cache_kind: CACHE_TTLS entry giving how long the response stays fresh
+        
+        Returns:
+            Parsed response, or None on an HTTP error
+        """
+        cache_key = (ETHERSCAN_API_URL, tuple(sorted(params.items())))
+        entry = self._cached_response(cache_key)
+        if entry is not None and time.monotonic() < entry[2]:
+            return entry[1]
+        
+        response = self._get(ETHERSCAN_API_URL, params={**params, 'apikey': self.etherscan_key}, timeout=10)
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        # Rate-limit and RPC errors are not worth remembering
+        if data.get('message') != 'NOTOK' and 'error' not in data:
+            self._cache_response(cache_key, None, data, cache_kind)
+        return data
+    
     def extract_github_username(self, url_or_username: str) -> Optional[str]:
         """
         Extract GitHub username from URL or return username directly
@@ -82,7 +477,7 @@ class DueDiligenceAnalyzer:
             return None
         
         # If it's already a username (no special chars except hyphens)
-        if re.match(r'^[a-zA-Z0-9\-]+$', url_or_username):
+        if _GITHUB_USERNAME_RE.fullmatch(url_or_username):
             return url_or_username
         
         # Try to extract from URL
@@ -110,21 +505,89 @@ class DueDiligenceAnalyzer:
         """
         try:
             url = f"https://api.github.com/users/{username}"
-            response = self.session.get(url, headers=self.github_headers, timeout=10)
+            status_code, data = self._github_get(url, 'github_user')
             
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 404:
+            if status_code == 200:
+                return data
+            elif status_code == 404:
                 logger.warning(f"GitHub user not found: {username}")
                 return None
             else:
-                logger.error(f"GitHub API error: {response.status_code}")
+                logger.error(f"GitHub API error: {status_code}")
                 return None
                 
         except Exception as e:
             logger.error(f"Error fetching GitHub user {username}: {e}")
             return None
     
+    def fetch_github_profile_graphql(
+        self,
+        username: str
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Fetch GitHub user profile and repositories in one GraphQL request
+        
+        Requires a GitHub token (the GraphQL API does not allow anonymous access).
+        Returns None for organization accounts and GraphQL-level errors, so
+        callers can fall back to the REST endpoints.
+        
+        Args:
+            username: GitHub username
+        
+        Returns:
+            Tuple of (user, repos) in the REST API field layout, or None
+        """
+        cache_key = (GITHUB_GRAPHQL_URL, (('login', username),))
+        entry = self._cached_response(cache_key)
+        if entry is not None and time.monotonic() < entry[2]:
+            return entry[1]
+        
+        try:
+            response = self._request(
+                'POST',
+                GITHUB_GRAPHQL_URL,
+                json={'query': GITHUB_PROFILE_QUERY, 'variables': {'login': username}},
+                headers=self.github_headers,
+                timeout=10
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"GitHub GraphQL API error: {response.status_code}")
+                return None
+            
+            data = response.json()
+            if data.get('errors'):
+                # Rate limits, missing token scopes etc. come back as HTTP 200
+                logger.warning(f"GitHub GraphQL errors for {username}: {data['errors']}")
+                return None
+            user = (data.get('data') or {}).get('user')
+            if not user:
+                # Also the case for organization accounts, which REST still serves
+                logger.warning(f"GitHub GraphQL user not found: {username}")
+                return None
+            
+            profile = {
+                'created_at': user.get('createdAt', ''),
+                'public_repos': user['publicRepos']['totalCount'],
+                'followers': user['followers']['totalCount'],
+                'following': user['following']['totalCount']
+            }
+            repos = [
+                {
+                    'stargazers_count': repo.get('stargazerCount', 0),
+                    'forks_count': repo.get('forkCount', 0),
+                    'language': (repo.get('primaryLanguage') or {}).get('name'),
+                    'updated_at': repo.get('updatedAt', '1970-01-01T00:00:00Z')
+                }
+                for repo in user['repositories']['nodes']
+            ]
+            self._cache_response(cache_key, None, (profile, repos), 'github_profile')
+            return profile, repos
+            
+        except Exception as e:
+            logger.error(f"Error fetching GitHub profile for {username}: {e}")
+            return None
+    
     def fetch_github_repos(self, username: str, max_repos: int = 100) -> List[Dict[str, Any]]:
         """
         Fetch user's GitHub repositories
@@ -143,12 +606,12 @@ class DueDiligenceAnalyzer:
                 'per_page': min(max_repos, 100),
                 'type': 'all'
             }
-            response = self.session.get(url, headers=self.github_headers, params=params, timeout=10)
+            status_code, data = self._github_get(url, 'github_repos', params)
             
-            if response.status_code == 200:
-                return response.json()
+            if status_code == 200:
+                return data
             else:
-                logger.error(f"GitHub repos API error: {response.status_code}")
+                logger.error(f"GitHub repos API error: {status_code}")
                 return []
                 
         except Exception as e:
@@ -169,18 +632,19 @@ class DueDiligenceAnalyzer:
         try:
             url = f"https://api.github.com/users/{username}/events"
             params = {'per_page': min(max_events, 100)}
-            response = self.session.get(url, headers=self.github_headers, params=params, timeout=10)
+            status_code, data = self._github_get(url, 'github_events', params)
             
-            if response.status_code == 200:
-                return response.json()
+            if status_code == 200:
+                return data
             else:
-                logger.error(f"GitHub events API error: {response.status_code}")
+                logger.error(f"GitHub events API error: {status_code}")
                 return []
                 
         except Exception as e:
             logger.error(f"Error fetching GitHub events for {username}: {e}")
             return []
     
+    @_with_throttle_budget
     def analyze_github_profile(self, username: str) -> Dict[str, Any]:
         """
         Comprehensive GitHub profile analysis
@@ -209,8 +673,13 @@ class DueDiligenceAnalyzer:
             'strengths': []
         }
         
-        # Fetch user profile
-        user = self.fetch_github_user(username)
+        # Fetch user profile, along with the repositories when GraphQL is
+        # available; REST covers the rest (repositories are fetched below)
+        user, repos = None, None
+        if self.github_token:
+            user, repos = self.fetch_github_profile_graphql(username) or (None, None)
+        if not user:
+            user = self.fetch_github_user(username)
         if not user:
             analysis['red_flags'].append("GitHub profile not found or inaccessible")
             return analysis
@@ -220,56 +689,78 @@ class DueDiligenceAnalyzer:
         analysis['followers'] = user.get('followers', 0)
         analysis['following'] = user.get('following', 0)
         
-        # Calculate account age
-        created_at = datetime.strptime(user.get('created_at', ''), '%Y-%m-%dT%H:%M:%SZ')
-        account_age = (datetime.utcnow() - created_at).days
+        # Calculate account age (one reference time for all age calculations)
+        now = datetime.utcnow()
+        created_at = _parse_github_timestamp(user.get('created_at', ''))
+        account_age = (now - created_at).days
         analysis['account_age_days'] = account_age
         
-        # Fetch repositories
-        repos = self.fetch_github_repos(username)
+        # Fetch repositories (unless GraphQL already returned them) and recent
+        # activity; both only need the username, so they run concurrently.
+        # Brand-new accounts skip both. The list is still fetched when
+        # public_repos is 0, since it includes repositories the user
+        # collaborates on, which public_repos does not count
+        if account_age < self.NEW_ACCOUNT_DAYS:
+            repos, events = repos or [], []
+        elif repos is None:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                repos_future = _submit(executor, self.fetch_github_repos, username)
+                events_future = _submit(executor, self.fetch_github_events, username)
+            repos = repos_future.result()
+            events = events_future.result()
+        else:
+            events = self.fetch_github_events(username)
+        
         if repos:
-            # Calculate total stars and forks
-            analysis['total_stars'] = sum(r.get('stargazers_count', 0) for r in repos)
-            analysis['total_forks'] = sum(r.get('forks_count', 0) for r in repos)
-            
-            # Extract languages
-            languages = {}
+            # Total stars and forks, languages and the latest update in one pass
+            total_stars = total_forks = 0
+            languages = Counter()
+            latest_update = ''
             for repo in repos:
+                total_stars += repo.get('stargazers_count', 0)
+                total_forks += repo.get('forks_count', 0)
                 lang = repo.get('language')
                 if lang:
-                    languages[lang] = languages.get(lang, 0) + 1
-            analysis['languages'] = sorted(languages.keys(), key=lambda x: languages[x], reverse=True)[:5]
+                    languages[lang] += 1
+                updated_at = repo.get('updated_at', '1970-01-01T00:00:00Z')
+                if updated_at > latest_update:
+                    latest_update = updated_at
+            
+            analysis['total_stars'] = total_stars
+            analysis['total_forks'] = total_forks
+            analysis['languages'] = [lang for lang, _ in languages.most_common(5)]
             
             # Check for recent updates
-            if repos:
-                latest_update = max(
-                    datetime.strptime(r.get('updated_at', '1970-01-01T00:00:00Z'), '%Y-%m-%dT%H:%M:%SZ')
-                    for r in repos
-                )
-                days_since_update = (datetime.utcnow() - latest_update).days
-                analysis['recent_activity_days'] = days_since_update
-                analysis['is_active'] = days_since_update <= 30
+            days_since_update = (now - _parse_github_timestamp(latest_update)).days
+            analysis['recent_activity_days'] = days_since_update
+            analysis['is_active'] = days_since_update <= 30
         
-        # Fetch recent activity
-        events = self.fetch_github_events(username)
+        # Analyze recent activity
         if events:
-            # Analyze commit frequency from recent events
-            commit_events = [e for e in events if e.get('type') in ['PushEvent', 'PullRequestEvent']]
-            if commit_events:
-                event_dates = [
-                    datetime.strptime(e.get('created_at', ''), '%Y-%m-%dT%H:%M:%SZ')
-                    for e in commit_events
-                ]
-                if len(event_dates) > 1:
-                    date_range = (max(event_dates) - min(event_dates)).days
-                    if date_range > 0:
-                        freq = len(commit_events) / max(date_range, 1)
-                        if freq > 1:
-                            analysis['commit_frequency'] = 'high'
-                        elif freq > 0.3:
-                            analysis['commit_frequency'] = 'medium'
-                        else:
-                            analysis['commit_frequency'] = 'low'
+            # Analyze commit frequency from recent events in a single pass; ISO
+            # 8601 timestamps sort as strings, so only the endpoints are parsed
+            commit_count = 0
+            first_commit = last_commit = None
+            for event in events:
+                if event.get('type') in self.COMMIT_EVENT_TYPES:
+                    commit_count += 1
+                    created = event.get('created_at', '')
+                    if first_commit is None or created < first_commit:
+                        first_commit = created
+                    if last_commit is None or created > last_commit:
+                        last_commit = created
+            if commit_count > 1:
+                date_range = (
+                    _parse_github_timestamp(last_commit) - _parse_github_timestamp(first_commit)
+                ).days
+                if date_range > 0:
+                    freq = commit_count / max(date_range, 1)
+                    if freq > 1:
+                        analysis['commit_frequency'] = 'high'
+                    elif freq > 0.3:
+                        analysis['commit_frequency'] = 'medium'
+                    else:
+                        analysis['commit_frequency'] = 'low'
         
         # Calculate contribution score (0-100)
         score = 0
@@ -308,6 +799,7 @@ class DueDiligenceAnalyzer:
         
         return analysis
     
+    @_with_throttle_budget
     def analyze_wallet_address(self, address: str, network: str = 'ethereum') -> Dict[str, Any]:
         """
         Analyze blockchain wallet address
@@ -334,7 +826,7 @@ class DueDiligenceAnalyzer:
         }
         
         # Validate Ethereum address format
-        if not re.match(r'^0x[a-fA-F0-9]{40}$', address):
+        if not _ETH_ADDRESS_RE.fullmatch(address):
             analysis['red_flags'].append("Invalid Ethereum address format")
             return analysis
         
@@ -347,87 +839,72 @@ class DueDiligenceAnalyzer:
             return analysis
         
         try:
-            # Fetch account balance
-            balance_url = "https://api.etherscan.io/api"
-            balance_params = {
-                'module': 'account',
-                'action': 'balance',
-                'address': address,
-                'tag': 'latest',
-                'apikey': self.etherscan_key
-            }
-            balance_response = self.session.get(balance_url, params=balance_params, timeout=10)
-            
-            if balance_response.status_code == 200:
-                balance_data = balance_response.json()
-                if balance_data.get('status') == '1':
-                    wei_balance = int(balance_data.get('result', '0'))
-                    analysis['balance_eth'] = wei_balance / 1e18
-            
-            # Fetch transaction count
-            tx_count_params = {
-                'module': 'proxy',
-                'action': 'eth_getTransactionCount',
-                'address': address,
-                'tag': 'latest',
-                'apikey': self.etherscan_key
-            }
-            tx_count_response = self.session.get(balance_url, params=tx_count_params, timeout=10)
-            
-            if tx_count_response.status_code == 200:
-                tx_count_data = tx_count_response.json()
-                if tx_count_data.get('result'):
-                    analysis['transaction_count'] = int(tx_count_data.get('result', '0x0'), 16)
-            
-            # Fetch recent transactions for timeline analysis
-            tx_list_params = {
+            # Balance, transaction count, first and last transaction and
+            # contract code are independent lookups, so they are fetched
+            # concurrently
+            first_tx_params = {
                 'module': 'account',
                 'action': 'txlist',
                 'address': address,
                 'startblock': 0,
                 'endblock': 99999999,
                 'page': 1,
-                'offset': 10,
-                'sort': 'asc',
-                'apikey': self.etherscan_key
+                'offset': 1,
+                'sort': 'asc'
             }
-            tx_list_response = self.session.get(balance_url, params=tx_list_params, timeout=10)
+            last_tx_params = dict(first_tx_params, sort='desc')
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                balance_future = _submit(executor, self._etherscan_get, {
+                    'module': 'account',
+                    'action': 'balance',
+                    'address': address,
+                    'tag': 'latest'
+                }, 'etherscan_balance')
+                tx_count_future = _submit(executor, self._etherscan_get, {
+                    'module': 'proxy',
+                    'action': 'eth_getTransactionCount',
+                    'address': address,
+                    'tag': 'latest'
+                }, 'etherscan_transactions')
+                first_tx_future = _submit(executor, self._etherscan_get, first_tx_params, 'etherscan_transactions')
+                last_tx_future = _submit(executor, self._etherscan_get, last_tx_params, 'etherscan_transactions')
+                code_future = _submit(executor, self._etherscan_get, {
+                    'module': 'proxy',
+                    'action': 'eth_getCode',
+                    'address': address,
+                    'tag': 'latest'
+                }, 'etherscan_code')
             
-            if tx_list_response.status_code == 200:
-                tx_list_data = tx_list_response.json()
-                if tx_list_data.get('status') == '1' and tx_list_data.get('result'):
-                    transactions = tx_list_data['result']
-                    if transactions:
-                        first_tx = transactions[0]
-                        analysis['first_tx_date'] = datetime.fromtimestamp(int(first_tx['timeStamp']))
-                        
-                        # Get latest tx
-                        last_tx_params = tx_list_params.copy()
-                        last_tx_params['sort'] = 'desc'
-                        last_tx_params['offset'] = 1
-                        last_tx_response = self.session.get(balance_url, params=last_tx_params, timeout=10)
-                        
-                        if last_tx_response.status_code == 200:
-                            last_tx_data = last_tx_response.json()
-                            if last_tx_data.get('result'):
-                                last_tx = last_tx_data['result'][0]
-                                analysis['last_tx_date'] = datetime.fromtimestamp(int(last_tx['timeStamp']))
-                                analysis['account_age_days'] = (datetime.utcnow() - analysis['first_tx_date']).days
+            # Account balance
+            balance_data = balance_future.result()
+            if balance_data and balance_data.get('status') == '1':
+                wei_balance = int(balance_data.get('result', '0'))
+                analysis['balance_eth'] = wei_balance / 1e18
             
-            # Check if contract
-            code_params = {
-                'module': 'proxy',
-                'action': 'eth_getCode',
-                'address': address,
-                'tag': 'latest',
-                'apikey': self.etherscan_key
-            }
-            code_response = self.session.get(balance_url, params=code_params, timeout=10)
+            # Transaction count
+            tx_count_data = tx_count_future.result()
+            if tx_count_data and tx_count_data.get('result'):
+                analysis['transaction_count'] = int(tx_count_data.get('result', '0x0'), 16)
+            
+            # Recent transactions for timeline analysis
+            first_tx_data = first_tx_future.result()
+            if first_tx_data and first_tx_data.get('status') == '1' and first_tx_data.get('result'):
+                transactions = first_tx_data['result']
+                if transactions:
+                    first_tx = transactions[0]
+                    analysis['first_tx_date'] = datetime.fromtimestamp(int(first_tx['timeStamp']))
+                    
+                    # Get latest tx
+                    last_tx_data = last_tx_future.result()
+                    if last_tx_data and last_tx_data.get('result'):
+                        last_tx = last_tx_data['result'][0]
+                        analysis['last_tx_date'] = datetime.fromtimestamp(int(last_tx['timeStamp']))
+                        analysis['account_age_days'] = (datetime.utcnow() - analysis['first_tx_date']).days
             
-            if code_response.status_code == 200:
-                code_data = code_response.json()
-                if code_data.get('result') and code_data['result'] != '0x':
-                    analysis['is_contract'] = True
+            # Check if contract
+            code_data = code_future.result()
+            if code_data and code_data.get('result') and code_data['result'] != '0x':
+                analysis['is_contract'] = True
             
             # Identify red flags
             if analysis['transaction_count'] == 0:
@@ -587,6 +1064,7 @@ class DueDiligenceAnalyzer:
         
         return int(final_score), confidence
     
+    @_with_throttle_budget
     def perform_due_diligence(
         self,
         grant_id: str,
@@ -612,23 +1090,30 @@ class DueDiligenceAnalyzer:
         
         logger.info(f"Starting due diligence for grant {grant_id}")
         
-        # Analyze GitHub profiles
-        github_analyses = []
+        # GitHub usernames and wallet addresses are case-insensitive, so a
+        # profile or wallet listed more than once is only analyzed once
+        usernames = []
+        seen_users = set()
         for profile in github_profiles:
             if profile:
                 username = self.extract_github_username(profile)
-                if username:
-                    analysis = self.analyze_github_profile(username)
-                    github_analyses.append(analysis)
-                    time.sleep(0.5)  # Rate limiting
-        
-        # Analyze wallet addresses
-        wallet_analyses = []
+                if username and username.lower() not in seen_users:
+                    seen_users.add(username.lower())
+                    usernames.append(username)
+        addresses = []
+        seen_wallets = set()
         for address in wallet_addresses:
-            if address:
-                analysis = self.analyze_wallet_address(address)
-                wallet_analyses.append(analysis)
-                time.sleep(0.5)  # Rate limiting
+            if address and address.lower() not in seen_wallets:
+                seen_wallets.add(address.lower())
+                addresses.append(address)
+        
+        # Analyze GitHub profiles and wallet addresses concurrently; the
+        # per-host semaphores in _get keep each API's request rate in check
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            github_futures = [_submit(executor, self.analyze_github_profile, u) for u in usernames]
+            wallet_futures = [_submit(executor, self.analyze_wallet_address, a) for a in addresses]
+            github_analyses = [future.result() for future in github_futures]
+            wallet_analyses = [future.result() for future in wallet_futures]
         
         # Detect red flags
         detected_red_flags = self.detect_red_flags(team_info, github_profiles, wallet_addresses)
@@ -23,19 +23,32 @@ class MilestoneEvaluator:
         self.reviews_repo = ReviewsRepository()
         self.milestones_repo = MilestonesRepository()
     
-    async def evaluate_milestone(self, milestone_id: str) -> Optional[Dict[str, Any]]:
+    async def evaluate_milestone(
+        self,
+        milestone_id: str,
+        persist: bool = True,
+        context: Optional[Dict[str, Any]] = None,
+        raise_errors: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Evaluate a submitted milestone using the Due Diligence agent
         
         Args:
             milestone_id: UUID of the milestone to evaluate
+            persist: Save the review immediately (default: True). Pass False to get
+                the unsaved review data back, e.g. to batch-insert many reviews.
+            context: Milestone row the caller already fetched (optional). Skips
+                loading the milestone again when provided.
+            raise_errors: Re-raise evaluation errors instead of returning None, so
+                callers can tell a failure from a milestone that needs no review.
             
         Returns:
-            Created agent review record or None if evaluation fails
+            Created agent review record (or unsaved review data when persist=False),
+            or None if the milestone needs no review or evaluation fails
         """
         try:
             # Get milestone details
-            milestone = self.milestones_repo.get_by_id(milestone_id)
+            milestone = context if context is not None else self.milestones_repo.get_by_id(milestone_id)
             if not milestone:
                 logger.error(f"Milestone {milestone_id} not found")
                 return None
@@ -86,6 +99,10 @@ class MilestoneEvaluator:
                 'review_duration_seconds': evaluation.get('review_duration_seconds', 0)
             }
             
+            if not persist:
+                logger.info(f"Due Diligence agent evaluated milestone {milestone_id}: {evaluation['recommendation']}")
+                return review_data
+            
             created_review = self.reviews_repo.create_agent_review(**review_data)
             
             logger.info(f"Due Diligence agent completed review for milestone {milestone_id}: {evaluation['recommendation']}")
@@ -94,6 +111,8 @@ class MilestoneEvaluator:
             
         except Exception as e:
             logger.error(f"Error evaluating milestone {milestone_id}: {e}", exc_info=True)
+            if raise_errors:
+                raise
             return None
     
     async def _evaluate_proof_of_work(self, milestone_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,116 @@
+"""
+Tests for the community sentiment analyzer's running vote totals
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.community_sentiment import CommunitySentimentAnalyzer, VotingStrategy
+
+TOTAL_TOKENS = 1_000_000
+
+VOTES = [
+    {"voter_address": f"0x{i:040x}", "option": option, "token_balance": balance, "reputation_score": reputation}
+    for i, (option, balance, reputation) in enumerate([
+        ("strongly_approve", 50_000, 90),
+        ("approve", 12_500.5, 70),
+        ("neutral", 3_000, 50),
+        ("reject", 40_000, 20),
+        ("approve", 0, 65),
+        ("strongly_reject", 7_250, 35),
+        ("strongly_approve", 100_000, 100),
+        ("approve", 800, 10),
+        ("neutral", 25_000, 80),
+        ("approve", 61_000, 55),
+        ("reject", 1_500, 45),
+        ("strongly_approve", 9_999, 75)
+    ])
+]
+
+
+def _comparable(analysis):
+    """An analysis without the fields that differ between two calls"""
+    return {key: value for key, value in analysis.items() if key not in ("poll_id", "analysis_timestamp")}
+
+
+def test_add_vote_rejects_repeat_voter():
+    """A voter's second vote on a poll is not counted"""
+    analyzer = CommunitySentimentAnalyzer()
+
+    assert analyzer.add_vote("poll-1", VOTES[0], VotingStrategy.HYBRID, TOTAL_TOKENS)
+    assert not analyzer.add_vote(
+        "poll-1", {**VOTES[0], "option": "strongly_reject"}, VotingStrategy.HYBRID, TOTAL_TOKENS
+    )
+
+    analysis = analyzer.analyze_poll_results("poll-1", None, VotingStrategy.HYBRID, TOTAL_TOKENS)
+    assert analysis["vote_statistics"]["total_votes"] == 1
+    assert analysis["vote_statistics"]["unique_voters"] == 1
+    assert set(analysis["option_breakdown"]) == {"strongly_approve"}
+
+
+def test_running_totals_match_vote_list():
+    """Analyzing add_vote's running totals gives the same result as the full vote list"""
+    for strategy in VotingStrategy:
+        analyzer = CommunitySentimentAnalyzer()
+
+        for vote in VOTES:
+            assert analyzer.add_vote("incremental", vote, strategy, TOTAL_TOKENS)
+        incremental = analyzer.analyze_poll_results("incremental", None, strategy, TOTAL_TOKENS)
+        from_list = analyzer.analyze_poll_results("from-list", VOTES, strategy, TOTAL_TOKENS)
+
+        assert "error" not in from_list
+        assert _comparable(incremental) == _comparable(from_list)
+
+
+def test_running_totals_are_bounded():
+    """Only the most recently used POLL_CACHE_SIZE polls keep running totals"""
+    analyzer = CommunitySentimentAnalyzer()
+    analyzer.POLL_CACHE_SIZE = 2
+
+    for poll_id in ("a", "b"):
+        analyzer.analyze_poll_results(poll_id, VOTES, VotingStrategy.HYBRID, TOTAL_TOKENS)
+    analyzer.analyze_poll_results("a", None, VotingStrategy.HYBRID, TOTAL_TOKENS)
+    analyzer.analyze_poll_results("c", VOTES, VotingStrategy.HYBRID, TOTAL_TOKENS)
+
+    assert list(analyzer._tallies) == ["a", "c"]
+
+
+def test_explicit_poll_options_override_cached_table():
+    """Options passed with an analysis win over, and replace, the poll's cached table"""
+    analyzer = CommunitySentimentAnalyzer()
+    all_reject = [{"id": vote["option"], "value": 0} for vote in VOTES]
+    all_approve = [{"id": vote["option"], "value": 100} for vote in VOTES]
+    first = analyzer.analyze_poll_results(
+        "poll-1", VOTES, VotingStrategy.HYBRID, TOTAL_TOKENS, poll_options=all_reject
+    )
+    explicit = analyzer.analyze_poll_results(
+        "poll-1", VOTES, VotingStrategy.HYBRID, TOTAL_TOKENS, poll_options=all_approve
+    )
+    cached = analyzer.analyze_poll_results("poll-1", VOTES, VotingStrategy.HYBRID, TOTAL_TOKENS)
+
+    assert explicit["sentiment"]["sentiment_score"] > first["sentiment"]["sentiment_score"]
+    assert _comparable(cached) == _comparable(explicit)
+
+
+def test_arrays_value_votes_like_vote_list():
+    """The column-wise entry point looks vote values up from the same option table"""
+    analyzer = CommunitySentimentAnalyzer()
+    poll_options = [{"id": vote["option"], "value": 10 * i} for i, vote in enumerate(VOTES)]
+
+    from_list = analyzer.analyze_poll_results(
+        "poll-1", VOTES, VotingStrategy.HYBRID, TOTAL_TOKENS, poll_options=poll_options
+    )
+    from_arrays = analyzer.analyze_poll_results_arrays(
+        "poll-1",
+        [vote["voter_address"] for vote in VOTES],
+        [vote["option"] for vote in VOTES],
+        [50.0] * len(VOTES),
+        [vote["token_balance"] for vote in VOTES],
+        [vote["reputation_score"] for vote in VOTES],
+        VotingStrategy.HYBRID,
+        TOTAL_TOKENS
+    )
+
+    assert _comparable(from_arrays) == _comparable(from_list)
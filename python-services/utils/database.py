@@ -34,6 +34,17 @@ class DatabaseConfig:
         
         # Connection timeout
         self.connection_timeout = int(os.getenv('DB_CONNECTION_TIMEOUT', '30'))
+        
+        # TCP keepalives so a dead server is noticed in seconds rather than the
+        # OS default of ~2 hours, e.g. while a worker sits idle on LISTEN
+        self.keepalives_idle = int(os.getenv('DB_KEEPALIVES_IDLE', '30'))
+        self.keepalives_interval = int(os.getenv('DB_KEEPALIVES_INTERVAL', '10'))
+        self.keepalives_count = int(os.getenv('DB_KEEPALIVES_COUNT', '3'))
+        
+        # Server-side cap on any single statement (milliseconds). Off by default:
+        # it would apply to every pooled connection, and transaction-mode poolers
+        # may reject the startup "options" parameter it is sent through
+        self.statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '0'))
 
 
 class DatabaseConnectionPool:
@@ -58,13 +69,23 @@ class DatabaseConnectionPool:
         """Initialize the connection pool"""
         config = DatabaseConfig()
         
+        # Only send startup options when a timeout is opted into
+        connect_kwargs = {}
+        if config.statement_timeout > 0:
+            connect_kwargs['options'] = f"-c statement_timeout={config.statement_timeout}"
+        
         try:
             self._pool = pool.ThreadedConnectionPool(
                 minconn=config.min_connections,
                 maxconn=config.max_connections,
                 dsn=config.database_url,
                 connect_timeout=config.connection_timeout,
-                cursor_factory=extras.RealDictCursor  # Return results as dicts
+                keepalives=1,
+                keepalives_idle=config.keepalives_idle,
+                keepalives_interval=config.keepalives_interval,
+                keepalives_count=config.keepalives_count,
+                cursor_factory=extras.RealDictCursor,  # Return results as dicts
+                **connect_kwargs
             )
             logger.info(
                 f"✅ Database connection pool initialized "